@@ -2,9 +2,13 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 import numpy as np
+import math
 import gdspy
 import picwriter.toolkit as tk
 
+_PI = math.pi
+_PI_2 = 0.5 * math.pi
+
 
 class Disk(tk.Component):
     """Disk Resonator Cell class.
@@ -17,11 +21,13 @@ class Disk(tk.Component):
     Keyword Args:
        * **wrap_angle** (float): Angle in *radians* between 0 and pi (defaults to 0) that determines how much the bus waveguide wraps along the resonator.  0 corresponds to a straight bus waveguide, and pi corresponds to a bus waveguide wrapped around half of the resonator.
        * **parity** (1 or -1): If 1, resonator to left of bus waveguide, if -1 resonator to the right
+       * **tolerance** (float): Maximum deviation (in microns) of the polygon edges from the ideal circular arcs.  Larger values give fewer vertices, and smaller files.  Defaults to None (the `grid` value of the WaveguideTemplate).
        * **port** (tuple): Cartesian coordinate of the input port (x1, y1)
        * **direction** (string): Direction that the component will point *towards*, can be of type `'NORTH'`, `'WEST'`, `'SOUTH'`, `'EAST'`, OR an angle (float, in radians)
 
     Members:
        * **portlist** (dict): Dictionary with the relevant port information
+       * **bus_length** (float): Length of the bus waveguide (distance between the input and output ports, along the bus axis)
 
     Portlist format:
        * portlist['input'] = {'port': (x1,y1), 'direction': 'dir1'}
@@ -39,6 +45,7 @@ class Disk(tk.Component):
         coupling_gap,
         wrap_angle=0,
         parity=1,
+        tolerance=None,
         port=(0, 0),
         direction="EAST",
     ):
@@ -53,271 +60,221 @@ class Disk(tk.Component):
         self.radius = radius
         self.coupling_gap = coupling_gap
         self.wrap_angle = wrap_angle
-        if (wrap_angle > np.pi) or (wrap_angle < 0):
+        if (wrap_angle > _PI) or (wrap_angle < 0):
             raise ValueError(
                 "Warning! Wrap_angle is nor a valid angle between 0 and pi."
             )
+        if parity not in (1, -1):
+            raise ValueError(
+                "Warning!  Parity value is not an acceptable value (must be +1 or -1)."
+            )
         self.parity = parity
+        self.tolerance = wgt.grid if tolerance == None else tolerance
         self.resist = wgt.resist
         self.wgt = wgt
         self.wg_spec = {"layer": wgt.wg_layer, "datatype": wgt.wg_datatype}
         self.clad_spec = {"layer": wgt.clad_layer, "datatype": wgt.clad_datatype}
 
-        self.__build_cell()
+        # The bus length and disk position follow directly from the parameters, so the
+        # ports are known without building any polygons.
+        self.bus_length, stub_length, center = self.__get_bus_geometry()
+
+        if self.first_cell:
+            """ Only generate the geometry once for each unique set of parameters.
+            Identical disks are placed as references to the same cell, so the polygons
+            would be discarded anyway.
+            """
+            self.__build_cell(stub_length, center)
         self.__build_ports()
 
         """ Translate & rotate the ports corresponding to this specific component object
         """
         self._auto_transform_()
 
-    def __build_cell(self):
+    @classmethod
+    def array(
+        cls,
+        wgt,
+        radius,
+        coupling_gap,
+        ports,
+        wrap_angle=0,
+        parity=1,
+        tolerance=None,
+        direction="EAST",
+    ):
+        """Creates one Disk at each of the given ports, e.g. for a sweep over the radius or coupling gap.
+        Each of `radius`, `coupling_gap`, `wrap_angle`, `parity` and `direction` can be a single value
+        (shared by all the disks) or a list with one value per port.  Disks with identical parameters
+        share a single cell, so only the unique geometries are built.
+
+        Args:
+           * **wgt** (WaveguideTemplate):  WaveguideTemplate object
+           * **radius** (float or list): Radius of the disk resonators
+           * **coupling_gap** (float or list): Distance between the bus waveguide and resonators
+           * **ports** (list): List of Cartesian coordinates of the input ports [(x1, y1), (x2, y2), ...]
+
+        Keyword Args:
+           * **wrap_angle** (float or list): Angle in *radians* between 0 and pi that determines how much the bus waveguide wraps along the resonator.  Defaults to 0.
+           * **parity** (1, -1, or list): If 1, resonator to left of bus waveguide, if -1 resonator to the right.  Defaults to 1.
+           * **tolerance** (float): Maximum deviation (in microns) of the polygon edges from the ideal circular arcs.  Defaults to None (the `grid` value of the WaveguideTemplate).
+           * **direction** (string, float, or list): Direction that the disks will point *towards*.  Defaults to `'EAST'`.
+
+        Returns:
+           list of Disk objects, in the same order as `ports`
+
+        """
+        num_disks = len(ports)
+
+        def per_disk(value):
+            if isinstance(value, (list, tuple, np.ndarray)):
+                if len(value) != num_disks:
+                    raise ValueError(
+                        "Warning! Disk.array() was given "
+                        + str(len(value))
+                        + " values for a parameter, but "
+                        + str(num_disks)
+                        + " ports."
+                    )
+                return list(value)
+            return [value] * num_disks
+
+        return [
+            cls(
+                wgt,
+                r,
+                g,
+                wrap_angle=wa,
+                parity=p,
+                tolerance=tolerance,
+                port=tuple(port),
+                direction=d,
+            )
+            for (port, r, g, wa, p, d) in zip(
+                ports,
+                per_disk(radius),
+                per_disk(coupling_gap),
+                per_disk(wrap_angle),
+                per_disk(parity),
+                per_disk(direction),
+            )
+        ]
+
+    def __get_bus_geometry(self):
+        """Returns the length of the bus waveguide (distance between the input and output ports), the length
+        of each straight stub before and after the wrapped section, and the center of the disk.
+        """
+        r = self.radius
+        rp = r + self.wgt.wg_width / 2.0 + self.coupling_gap
+        if self.wrap_angle == 0:
+            return 2 * r, r, (r, self.parity * rp)
+
+        theta = self.wrap_angle / 2.0
+        dx, dy = rp * math.sin(theta), rp * (1.0 - math.cos(theta))
+        if 4 * dx < 2 * r:
+            bus_length, xcenter = 2 * r, r
+        else:
+            bus_length, xcenter = 4 * dx, 2 * dx
+        stub_length = (bus_length - 4 * dx) / 2.0
+        return bus_length, stub_length, (xcenter, self.parity * (rp - 2 * dy))
+
+    def __build_cell(self, stub_length, center):
         # Sequentially build all the geometric shapes using gdspy path functions
         # for waveguide, then add it to the Cell
+        bus_length = self.bus_length
+        r, g = self.radius, self.coupling_gap
+        wg_w, cl_w = self.wgt.wg_width, self.wgt.clad_width
+        clad_w_bus = 2 * cl_w + wg_w
+        rp = r + wg_w / 2.0 + g  # distance from the bus centerline to the disk center
 
         if self.wrap_angle == 0:
-            bus_length = 2 * self.radius
-            # Add bus waveguide with cladding
-            path = gdspy.Path(self.wgt.wg_width, (0, 0))
-            path.segment(2 * self.radius, direction="+x", **self.wg_spec)
-            clad = gdspy.Path(2 * self.wgt.clad_width + self.wgt.wg_width, (0, 0))
-            clad.segment(2 * self.radius, direction="+x", **self.clad_spec)
-
-            # Disk resonator
-            if self.parity == 1:
-                ring = gdspy.Round(
-                    (
-                        self.radius,
-                        self.radius + self.wgt.wg_width / 2.0 + self.coupling_gap,
-                    ),
-                    self.radius,
-                    number_of_points=self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius
-                    ),
-                    **self.wg_spec
-                )
-                clad_ring = gdspy.Round(
-                    (
-                        self.radius,
-                        self.radius + self.wgt.wg_width / 2.0 + self.coupling_gap,
-                    ),
-                    self.radius + self.wgt.clad_width,
-                    number_of_points=self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius + self.wgt.clad_width
-                    ),
-                    **self.clad_spec
-                )
-            elif self.parity == -1:
-                ring = gdspy.Round(
-                    (
-                        self.radius,
-                        -self.radius - self.wgt.wg_width / 2.0 - self.coupling_gap,
-                    ),
-                    self.radius,
-                    number_of_points=self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius
-                    ),
-                    **self.wg_spec
-                )
-                clad_ring = gdspy.Round(
-                    (
-                        self.radius,
-                        -self.radius - self.wgt.wg_width / 2.0 - self.coupling_gap,
-                    ),
-                    self.radius + self.wgt.clad_width,
-                    number_of_points=self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius + self.wgt.clad_width
-                    ),
-                    **self.clad_spec
-                )
-            else:
-                raise ValueError(
-                    "Warning!  Parity value is not an acceptable value (must be +1 or -1)."
-                )
+            # Straight bus waveguide
+            centerline = np.array([(0.0, 0.0), (bus_length, 0.0)])
+            normals = np.array([(0.0, 1.0), (0.0, 1.0)])
         elif self.wrap_angle > 0:
             theta = self.wrap_angle / 2.0
-            rp = self.radius + self.wgt.wg_width / 2.0 + self.coupling_gap
-            dx, dy = rp * np.sin(theta), rp - rp * np.cos(theta)
-            bus_length = 2 * self.radius if (4 * dx < 2 * self.radius) else 4 * dx
-
-            # Add bus waveguide with cladding that wraps
-            path = gdspy.Path(self.wgt.wg_width, (0, 0))
-            clad = gdspy.Path(2 * self.wgt.clad_width + self.wgt.wg_width, (0, 0))
-            if 4 * dx < bus_length:
-                path.segment(
-                    (bus_length - 4 * dx) / 2.0, direction="+x", **self.wg_spec
-                )
-                clad.segment(
-                    (bus_length - 4 * dx) / 2.0, direction="+x", **self.clad_spec
+            n_theta = self.wgt.get_num_points_curve(theta, rp, grid=self.tolerance)
+            n_2theta = self.wgt.get_num_points_curve(2 * theta, rp, grid=self.tolerance)
+
+            # The parity -1 bus is the mirror image (about the x-axis) of the parity 1 bus,
+            # so all arc angles simply flip sign.
+            sign = self.parity
+            arcs = [
+                (sign * _PI_2, sign * (_PI_2 - theta), n_theta),
+                (sign * (-_PI_2 - theta), sign * (-_PI_2 + theta), n_2theta),
+                (sign * (_PI_2 + theta), sign * _PI_2, n_theta),
+            ]
+
+            # Trace the bus centerline (straight stub, three tangent arcs, straight stub) along with
+            # the unit normal to the left of the direction of travel at every point.  The normal of
+            # an arc is radial, pointing towards its center for counter-clockwise arcs.  Consecutive
+            # arcs share their end points, and all the points are written into preallocated arrays.
+            num_start = 2 if stub_length > 0 else 1
+            num_points = num_start + sum([n - 1 for (a0, a1, n) in arcs])
+            num_points += 1 if stub_length > 0 else 0
+            centerline = np.empty((num_points, 2))
+            normals = np.empty((num_points, 2))
+            normals[:] = (0.0, 1.0)
+            centerline[0] = (0.0, 0.0)
+            centerline[num_start - 1] = (stub_length, 0.0)
+            centerline[-1] = (bus_length, 0.0)
+
+            i = num_start - 1  # index of the first point of the next arc
+            for initial_angle, final_angle, n in arcs:
+                x, y = centerline[i]
+                arc_center = (
+                    x - rp * math.cos(initial_angle),
+                    y - rp * math.sin(initial_angle),
                 )
-                xcenter = self.radius
-            else:
-                xcenter = 2 * dx
-
-            if self.parity == 1:
-                path.arc(
-                    rp,
-                    np.pi / 2.0,
-                    np.pi / 2.0 - theta,
-                    number_of_points=2 * self.wgt.get_num_points_curve(theta, rp),
-                    **self.wg_spec
+                unit_arc = tk.get_arc_points(
+                    (0, 0), 1.0, initial_angle, final_angle, n, out=normals[i : i + n]
                 )
-                path.arc(
-                    rp,
-                    -np.pi / 2.0 - theta,
-                    -np.pi / 2.0 + theta,
-                    number_of_points=2 * self.wgt.get_num_points_curve(2 * theta, rp),
-                    **self.wg_spec
-                )
-                path.arc(
-                    rp,
-                    np.pi / 2.0 + theta,
-                    np.pi / 2.0,
-                    number_of_points=2 * self.wgt.get_num_points_curve(theta, rp),
-                    **self.wg_spec
-                )
-                clad.arc(
-                    rp,
-                    np.pi / 2.0,
-                    np.pi / 2.0 - theta,
-                    number_of_points=2 * self.wgt.get_num_points_curve(theta, rp),
-                    **self.clad_spec
-                )
-                clad.arc(
-                    rp,
-                    -np.pi / 2.0 - theta,
-                    -np.pi / 2.0 + theta,
-                    number_of_points=2 * self.wgt.get_num_points_curve(2 * theta, rp),
-                    **self.clad_spec
-                )
-                clad.arc(
-                    rp,
-                    np.pi / 2.0 + theta,
-                    np.pi / 2.0,
-                    number_of_points=2 * self.wgt.get_num_points_curve(theta, rp),
-                    **self.clad_spec
-                )
-
-                # Make the disk resonator
-                ring = gdspy.Round(
-                    (
-                        xcenter,
-                        self.radius
-                        + self.wgt.wg_width / 2.0
-                        + self.coupling_gap
-                        - 2 * dy,
-                    ),
-                    self.radius,
-                    number_of_points=self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius
-                    ),
-                    **self.wg_spec
-                )
-                clad_ring = gdspy.Round(
-                    (
-                        xcenter,
-                        self.radius
-                        + self.wgt.wg_width / 2.0
-                        + self.coupling_gap
-                        - 2 * dy,
-                    ),
-                    self.radius + self.wgt.clad_width,
-                    number_of_points=self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius + self.wgt.clad_width
-                    ),
-                    **self.clad_spec
-                )
-
-            elif self.parity == -1:
-                path.arc(
-                    rp,
-                    -np.pi / 2.0,
-                    -np.pi / 2.0 + theta,
-                    number_of_points=2 * self.wgt.get_num_points_curve(theta, rp),
-                    **self.wg_spec
-                )
-                path.arc(
-                    rp,
-                    np.pi / 2.0 + theta,
-                    np.pi / 2.0 - theta,
-                    number_of_points=2 * self.wgt.get_num_points_curve(2 * theta, rp),
-                    **self.wg_spec
-                )
-                path.arc(
-                    rp,
-                    -np.pi / 2.0 - theta,
-                    -np.pi / 2.0,
-                    number_of_points=2 * self.wgt.get_num_points_curve(theta, rp),
-                    **self.wg_spec
-                )
-                clad.arc(
-                    rp,
-                    -np.pi / 2.0,
-                    -np.pi / 2.0 + theta,
-                    number_of_points=2 * self.wgt.get_num_points_curve(theta, rp),
-                    **self.clad_spec
-                )
-                clad.arc(
-                    rp,
-                    np.pi / 2.0 + theta,
-                    np.pi / 2.0 - theta,
-                    number_of_points=2 * self.wgt.get_num_points_curve(2 * theta, rp),
-                    **self.clad_spec
-                )
-                clad.arc(
-                    rp,
-                    -np.pi / 2.0 - theta,
-                    -np.pi / 2.0,
-                    number_of_points=2 * self.wgt.get_num_points_curve(theta, rp),
-                    **self.clad_spec
-                )
-
-                # Make the disk resonator
-                ring = gdspy.Round(
-                    (
-                        xcenter,
-                        -self.radius
-                        - self.wgt.wg_width / 2.0
-                        - self.coupling_gap
-                        + 2 * dy,
-                    ),
-                    self.radius,
-                    number_of_points=self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius
-                    ),
-                    **self.wg_spec
-                )
-                clad_ring = gdspy.Round(
-                    (
-                        xcenter,
-                        -self.radius
-                        - self.wgt.wg_width / 2.0
-                        - self.coupling_gap
-                        + 2 * dy,
-                    ),
-                    self.radius + self.wgt.clad_width,
-                    number_of_points=self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius + self.wgt.clad_width
-                    ),
-                    **self.clad_spec
-                )
-
-            if 4 * dx < bus_length:
-                path.segment((bus_length - 4 * dx) / 2.0, **self.wg_spec)
-                clad.segment((bus_length - 4 * dx) / 2.0, **self.clad_spec)
-
-        self.port_input = (0, 0)
-        self.port_output = (bus_length, 0)
-
-        self.add(ring)
-        self.add(clad_ring)
-        self.add(path)
-        self.add(clad)
+                centerline[i : i + n] = arc_center + rp * unit_arc
+                if final_angle > initial_angle:
+                    unit_arc *= -1.0
+                i += n - 1
+
+        # Each bus layer is a single closed polygon, offset from the shared centerline
+        bus = []
+        num_points = len(centerline)
+        outline = np.empty((2 * num_points, 2))
+        for width, spec in [(wg_w, self.wg_spec), (clad_w_bus, self.clad_spec)]:
+            offset = (width / 2.0) * normals
+            np.add(centerline, offset, out=outline[:num_points])
+            np.subtract(centerline, offset, out=outline[num_points:][::-1])
+            bus.append(gdspy.Polygon(outline, **spec).fracture())
+
+        # Make the disk resonator
+        self.add(self.__get_disk_cell(), origin=center)
+        for element in bus:
+            self.add(element)
+
+    def __get_disk_cell(self):
+        """Returns a cell containing the disk and its cladding centered at the origin.  Disks of the same
+        radius (on the same WaveguideTemplate) share this cell, so sweeps over the coupling gap or wrap angle
+        only store the circle polygons once.
+        """
+        cell_hash = "DiskRing" + self.wgt.name + str(self.radius) + str(self.tolerance)
+        if cell_hash not in tk.CURRENT_CELLS.keys():
+            r, cl_w = self.radius, self.wgt.clad_width
+            # The disk and its cladding are concentric, so both are scaled from the same unit circle.
+            # The point count is chosen for the (larger) cladding radius, which also keeps the disk
+            # edge within tolerance.
+            n_ring = self.wgt.get_num_points_curve(
+                2 * _PI, r + cl_w, grid=self.tolerance
+            )
+            unit_circle = tk.get_arc_points((0, 0), 1.0, 0.0, 2 * _PI, n_ring + 1)[:-1]
+            disk_cell = gdspy.Cell(tk.getCellName("DiskRing"))
+            for radius, spec in [(r, self.wg_spec), (r + cl_w, self.clad_spec)]:
+                disk_cell.add(gdspy.Polygon(radius * unit_circle, **spec).fracture())
+            tk.CURRENT_CELLS[cell_hash] = disk_cell
+        return tk.CURRENT_CELLS[cell_hash]
 
     def __build_ports(self):
         # Portlist format:
         # example: example:  {'port':(x_position, y_position), 'direction': 'NORTH'}
-        self.portlist["input"] = {"port": self.port_input, "direction": "WEST"}
-        self.portlist["output"] = {"port": self.port_output, "direction": "EAST"}
+        self.portlist["input"] = {"port": (0, 0), "direction": "WEST"}
+        self.portlist["output"] = {"port": (self.bus_length, 0), "direction": "EAST"}
 
 
 if __name__ == "__main__":
@@ -369,4 +326,3 @@ if __name__ == "__main__":
     tk.add(top, r3)
 
 #    gdspy.LayoutViewer()
-#    gdspy.write_gds('disk.gds', unit=1.0e-6, precision=1.0e-9)
@@ -1,12 +1,96 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import absolute_import, division, print_function, unicode_literals
+import math
 import numpy as np
 from scipy.special import fresnel
 import gdspy
 import picwriter.toolkit as tk
 
 
+_EULER_NORMS = {}
+
+
+def _get_euler_norm(turnby):
+    """Returns the end-point `t` of the normalized Euler (Fresnel) curve for an obtuse bend that turns by `turnby`
+    (in radians), along with the (x,y) position of the output of the normalized bend and the (normalized) distance
+    from the input to the vertex.  These only depend on the bend angle, which repeats often during waveguide routing,
+    so the results are cached.  Angles are rounded to 1e-12 radians, so that bend angles which only differ by
+    floating point noise (e.g. from computing the same turn with different waypoints) share a cache entry.
+    """
+    turnby = round(abs(float(turnby)), 12)
+    if turnby not in _EULER_NORMS:
+        if len(_EULER_NORMS) >= 4096:
+            _EULER_NORMS.clear()
+        t = np.sqrt((2 / np.pi) * abs(turnby / 2.0))
+        dy, dx = fresnel(t)
+        cos_t, sin_t = np.cos(abs(turnby)), np.sin(abs(turnby))
+        output_x_norm = dx + dx * cos_t - (-dy) * sin_t
+        output_y_norm = dy + dx * sin_t + (-dy) * cos_t
+        # The output leaves at angle turnby, so the vertex is output_y / tan(turnby) behind the output along x
+        _EULER_NORMS[turnby] = (
+            t,
+            output_x_norm,
+            output_y_norm,
+            output_x_norm - output_y_norm * cos_t / sin_t,
+        )
+    return _EULER_NORMS[turnby]
+
+
+# Acute Euler bends are made of two 45 degree Euler sections (t at which the slope is 1), joined by a circular arc
+_ACUTE_T = 1.0 / np.sqrt(2.0)
+_ACUTE_DY, _ACUTE_DX = fresnel(_ACUTE_T)
+
+
+def _get_section_transforms(rotation, scale_factor, sign):
+    """Returns the two (2,2) matrices that map normalized Fresnel points (rows of (x, y)) onto the Euler sections of a
+    bend, so that the scaling, mirroring (`sign`) and rotation of every point is a single matrix product.  The first
+    matrix gives the section leaving the input, and the second gives the section arriving at the output (relative to
+    the output, traced backwards), where `rotation` is the (cos, sin) of the rotation that places that section.
+    """
+    cos_t, sin_t = rotation
+    first = scale_factor * np.array([[1.0, 0.0], [0.0, sign]])
+    last = scale_factor * np.array([[-cos_t, sign * sin_t], [sin_t, sign * cos_t]])
+    return first, last
+
+
+def _get_bend_normals(points, start_direction, end_direction):
+    """Returns the unit normals (pointing to the left) of the sampled centerline `points`, an (N,2) array.  The normals
+    are exact at the two ends (given by `start_direction` and `end_direction`, in radians) and taken from the
+    neighboring points everywhere else.  All the layers of a bend share the same centerline, so this is computed once.
+    """
+    tangents = np.empty(points.shape)
+    tangents[1:-1] = points[2:] - points[:-2]
+    tangents[0] = (np.cos(start_direction), np.sin(start_direction))
+    tangents[-1] = (np.cos(end_direction), np.sin(end_direction))
+    normals = tangents[:, ::-1] * (-1.0, 1.0)
+    normals /= np.sqrt(normals[:, 0] ** 2 + normals[:, 1] ** 2)[:, np.newaxis]
+    return normals
+
+
+def _get_bend_polygons(points, normals, width, spec, distance=0, max_points=199):
+    """Returns a list of gdspy Polygons tracing a path of the given `width` (float, or array with one width per point)
+    along the sampled centerline `points`, with the edges offset along `normals` (see `_get_bend_normals`).  If `distance`
+    is nonzero, two paths are drawn with their centers separated by `distance` (as for slot waveguides).  Long paths are
+    split into polygons of at most `max_points` vertices.
+    """
+    half_width = np.reshape(np.asarray(width, dtype=float) / 2.0, (-1, 1))
+    offsets = [-distance / 2.0, distance / 2.0] if distance else [0.0]
+    step = (max_points - 1) // 2
+    polygons = []
+    for offset in offsets:
+        left = points + (offset + half_width) * normals
+        right = points + (offset - half_width) * normals
+        for i in range(0, len(points) - 1, step):
+            polygons.append(
+                gdspy.Polygon(
+                    np.vstack((left[i : i + step + 1], right[i : i + step + 1][::-1])),
+                    **spec
+                )
+            )
+    return polygons
+
+
 class EBend(tk.Component):
     """Euler shaped Bend Cell class.  Creates a generic Euler waveguide bend that can be used in waveguide routing.  The number of points is computed based on the waveguide template grid resolution to automatically minimize grid errors.
     This class can be automatically called and implemented during waveguide routing by passing `euler_bend=True` to a WaveguideTemplate object.  The smallest radius of curvature on the Euler bend is set to be the `bend_radius` value given by the WaveguideTemplate object passed to this class.
@@ -78,17 +162,13 @@ class EBend(tk.Component):
         self.output_direction = self.turnby
 
         self.sign = np.sign(self.turnby)
+        # (cos, sin) of the rotation by -abs(turnby) that places the last section of the curve
+        self.rotation = (math.cos(abs(self.turnby)), -math.sin(abs(self.turnby)))
         if abs(self.turnby) <= np.pi / 2.0:
             # Obtuse angle
             # Compute the value of t analytically
-            self.t = np.sqrt((2 / np.pi) * abs(self.turnby / 2.0))
-            dy, dx = fresnel(self.t)
-
-            output_x_norm = (
-                dx + dx * np.cos(abs(self.turnby)) - (-dy) * np.sin(abs(self.turnby))
-            )
-            output_y_norm = (
-                dy + dx * np.sin(abs(self.turnby)) + (-dy) * np.cos(abs(self.turnby))
+            self.t, output_x_norm, output_y_norm, dist_to_vertex_norm = _get_euler_norm(
+                abs(self.turnby)
             )
 
             self.scale_factor = self.wgt.bend_radius / self.__get_radius_of_curvature()
@@ -98,18 +178,13 @@ class EBend(tk.Component):
                 self.sign * self.scale_factor * output_y_norm,
             )
 
-            dist_to_vertex_norm = output_x_norm - (
-                output_y_norm / np.tan(abs(self.turnby))
-            )
             self.dist_to_vertex = dist_to_vertex_norm * self.scale_factor
 
         else:
             # Acute angle
             # t is equal to a 45 degree bend, the rest is connected by semi-circle joints
-            self.t = 1.0 / np.sqrt(
-                2.0
-            )  # Corresponds to the curve when the slope is equal to 1
-            dy, dx = fresnel(self.t)
+            self.t = _ACUTE_T  # Corresponds to the curve when the slope is equal to 1
+            dy, dx = _ACUTE_DY, _ACUTE_DX
 
             self.scale_factor = self.wgt.bend_radius / self.__get_radius_of_curvature()
 
@@ -119,8 +194,9 @@ class EBend(tk.Component):
                 dy * self.scale_factor + self.wgt.bend_radius * np.cos(np.pi / 4),
             )
 
+            half_angle = (np.pi - abs(self.turnby)) / 2
             self.dist_to_vertex = self.circle_center[0] + (
-                self.circle_center[1] / np.tan((np.pi - abs(self.turnby)) / 2)
+                self.circle_center[1] * np.cos(half_angle) / np.sin(half_angle)
             )
 
             self.output_port = (
@@ -132,24 +208,22 @@ class EBend(tk.Component):
         if vertex == None:
             self.port = port
         else:  # Place port according to the geometry & vertex specified
-            if (
-                self.direction == "EAST"
-            ):  # direction of the input port (which specifies whole component orientation)
-                vangle = 0.0
-            elif self.direction == "NORTH":
-                vangle = np.pi / 2.0
-            elif self.direction == "WEST":
-                vangle = np.pi
-            elif self.direction == "SOUTH":
-                vangle = 3 * np.pi / 2.0
+            # direction of the input port (which specifies whole component orientation)
+            if self.direction in tk.DIRECTION_TABLE:
+                cos_v, sin_v = tk.DIRECTION_TABLE[self.direction][1:]
             else:
-                vangle = self.direction
+                cos_v, sin_v = np.cos(self.direction), np.sin(self.direction)
             self.port = (
-                vertex[0] - self.dist_to_vertex * np.cos(vangle),
-                vertex[1] - self.dist_to_vertex * np.sin(vangle),
+                vertex[0] - self.dist_to_vertex * cos_v,
+                vertex[1] - self.dist_to_vertex * sin_v,
             )
 
-        self.__build_cell()
+        if self.first_cell:
+            """ Only generate the geometry once for each unique set of parameters.
+            Identical bends are placed as references to the same cell, so the polygons
+            would be discarded anyway.
+            """
+            self.__build_cell()
         self.__build_ports()
 
         """ Translate & rotate the ports corresponding to this specific component object
@@ -158,14 +232,10 @@ class EBend(tk.Component):
 
     def __get_radius_of_curvature(self):
         """Returns the *normalized* radius of curvature for the Euler curve"""
-        t = self.t
-        xp = np.cos((np.pi * t ** 2) / 2.0)  # First derivative of x(t) (FresnelC)
-        yp = np.sin((np.pi * t ** 2) / 2.0)  # First derivative of y(t) (FresnelS)
-        xpp = -np.pi * t * np.sin((np.pi * t ** 2) / 2.0)  # Second derivative of x(t)
-        ypp = np.pi * t * np.cos((np.pi * t ** 2) / 2.0)  # Second derivative of y(t)
-        return abs(
-            ((xp ** 2 + yp ** 2) ** (3 / 2)) / (xp * ypp - yp * xpp)
-        )  # Radius of curvature: https://en.wikipedia.org/wiki/Radius_of_curvature
+        # For the Fresnel curve x'(t) = cos(pi t^2 / 2), y'(t) = sin(pi t^2 / 2), so |x'|^2 + |y'|^2 = 1 and
+        # x' y'' - y' x'' = pi t.  The radius of curvature ((x'^2 + y'^2)^(3/2) / (x' y'' - y' x''), see
+        # https://en.wikipedia.org/wiki/Radius_of_curvature) at the end-point is therefore just 1 / (pi t)
+        return 1.0 / (np.pi * self.t) if self.t != 0 else np.inf
 
     def get_bend_length(self):
         """Returns the length of the Euler curve"""
@@ -178,92 +248,123 @@ class EBend(tk.Component):
             ) * (self.circle_angle / (2 * np.pi))
 
     def __euler_function(self, t):
-        # input (t) goes from 0->1
-        # Returns an (x,y) tuple
-        if t > 1.0 or t < 0.0:
+        # input (t) goes from 0->1, and can be a single value or a numpy array of values
+        # Returns a numpy array of the (x,y) points, with shape t.shape + (2,)
+        # The whole batch of t values is checked at once (the samplers only pass linspace(0, 1, N))
+        t = np.asarray(t, dtype=float)
+        if t.size > 0 and (t.min() < 0.0 or t.max() > 1.0):
             raise ValueError(
                 "Warning! A value was given to __euler_function not between 0 and 1"
             )
 
+        points = np.empty(t.shape + (2,))
+        x_out, y_out = points[..., 0], points[..., 1]  # views into points
+
         end_t = self.t  # (end-point)
+        first_transform, last_transform = _get_section_transforms(
+            self.rotation, self.scale_factor, self.sign
+        )
 
         if abs(self.turnby) <= np.pi / 2.0:
-            # Obtuse bend
-            if t < 0.5:
-                y, x = fresnel(2 * t * end_t)
-                return x * self.scale_factor, self.sign * y * self.scale_factor
-            else:
-                y, x = fresnel(2 * (1 - t) * end_t)
-                x, y = (
-                    x * np.cos(-self.sign * self.turnby)
-                    - y * np.sin(-self.sign * self.turnby),
-                    x * np.sin(-self.sign * self.turnby)
-                    + y * np.cos(-self.sign * self.turnby),
-                )
-                return (
-                    self.output_port[0] - x * self.scale_factor,
-                    self.output_port[1] + self.sign * y * self.scale_factor,
-                )
+            # Obtuse bend, the second half is a rotated copy of the first half traced backwards.
+            # All the Fresnel integrals are evaluated in a single call.
+            first_half = t < 0.5
+            y, x = fresnel(np.where(first_half, 2 * t, 2 * (1 - t)) * end_t)
+            xy = np.stack((x, y), axis=-1)
+            points[...] = np.where(
+                first_half[..., np.newaxis],
+                np.dot(xy, first_transform),
+                self.output_port + np.dot(xy, last_transform),
+            )
+            return points
 
         else:
-            # Acute bend
-            if t < 0.3:
-                # First section of Euler bend
-                y, x = fresnel((t / 0.3) * end_t)
-                return x * self.scale_factor, self.sign * y * self.scale_factor
-            elif t < 0.7:
-                t0 = (t - 0.3) / 0.4
-                return (
-                    self.circle_center[0]
-                    + self.wgt.bend_radius
-                    * np.cos(
-                        (-self.sign * np.pi / 4) + self.sign * self.circle_angle * t0
-                    ),
-                    self.sign * self.circle_center[1]
-                    + self.wgt.bend_radius
-                    * np.sin(
-                        (-self.sign * np.pi / 4) + self.sign * self.circle_angle * t0
-                    ),
-                )
-            else:
-                y, x = fresnel(((1 - t) / 0.3) * end_t)
-                x, y = (
-                    x * np.cos(-self.sign * self.turnby)
-                    - y * np.sin(-self.sign * self.turnby),
-                    x * np.sin(-self.sign * self.turnby)
-                    + y * np.cos(-self.sign * self.turnby),
-                )
-                return (
-                    self.output_port[0] - x * self.scale_factor,
-                    self.output_port[1] + self.sign * y * self.scale_factor,
-                )
+            # Acute bend, an Euler section, circular arc, then a (rotated) Euler section.
+            # Each point is only evaluated on the section it belongs to.
+            first, last = t < 0.3, t >= 0.7
+            circle = ~(first | last)
+
+            # Both Euler sections are evaluated with a single call to fresnel
+            num_first = np.count_nonzero(first)
+            y, x = fresnel(np.concatenate((t[first], 1 - t[last])) * (end_t / 0.3))
+            xy = np.column_stack((x, y))
+            points[first] = np.dot(xy[:num_first], first_transform)
+
+            circle_angle = (-self.sign * np.pi / 4) + self.sign * self.circle_angle * (
+                (t[circle] - 0.3) / 0.4
+            )
+            x_out[circle] = self.circle_center[0] + self.wgt.bend_radius * np.cos(
+                circle_angle
+            )
+            y_out[circle] = self.sign * self.circle_center[
+                1
+            ] + self.wgt.bend_radius * np.sin(circle_angle)
+
+            points[last] = self.output_port + np.dot(xy[num_first:], last_transform)
+            return points
+
+    def __get_num_points(self):
+        """Returns the number of (evenly spaced) values of t at which the Euler curve is sampled, such that
+        the polygon deviates from the true curve by less than half the grid size on the tightest bend.
+        """
+        # Sagitta of a chord of length ds on a circle of radius R:  ds**2 / (8 R) <= grid / 2
+        max_step = np.sqrt(4 * self.wgt.bend_radius * self.wgt.grid)
+        if abs(self.turnby) <= np.pi / 2.0:
+            length_per_t = 2 * self.t * self.scale_factor
+        else:
+            length_per_t = max(
+                self.t * self.scale_factor / 0.3,
+                self.wgt.bend_radius * self.circle_angle / 0.4,
+            )
+        num_points = max(int(np.ceil(length_per_t / max_step)) + 1, 3)
+        # An odd number of points puts a sample on the midpoint, so the halves of obtuse bends are congruent
+        return num_points + 1 - num_points % 2
+
+    def __sample_euler_function(self, num_points):
+        """Returns the Euler curve at `num_points` evenly spaced values of t, i.e. the same (N,2) array as
+        `__euler_function(np.linspace(0, 1, num_points))`.  The second half of an obtuse bend is a rotated copy of the
+        first half, so (for an odd number of points) the Fresnel integrals are only evaluated on the first half.
+        """
+        if abs(self.turnby) > np.pi / 2.0 or num_points % 2 == 0:
+            return self.__euler_function(np.linspace(0, 1, num_points))
+
+        num_half = (num_points + 1) // 2
+        y, x = fresnel(np.linspace(0, self.t, num_half))
+        xy = np.column_stack((x, y))
+        first_transform, last_transform = _get_section_transforms(
+            self.rotation, self.scale_factor, self.sign
+        )
+        points = np.empty((num_points, 2))
+        points[:num_half] = np.dot(xy, first_transform)
+        points[num_half - 1 :] = (self.output_port + np.dot(xy, last_transform))[::-1]
+        return points
 
     def __build_cell(self):
-        # Sequentially build all the geometric shapes using gdspy path functions
+        # Sequentially build all the geometric shapes from the sampled Euler curve
         # for waveguide, then add it to the Cell
 
         # Uncomment below to plot the function (useful for debugging)
         #        import matplotlib.pyplot as plt
         #        tvals = np.linspace(0,1,5000)
-        #        xy = [self.__euler_function(tv) for tv in tvals]
-        #        plt.scatter(*zip(*xy))
+        #        plt.scatter(*self.__euler_function(tvals).T)
         #        plt.show()
 
+        # The Euler curve is evaluated once (vectorized), and every layer is traced from the same points
+        num_points = self.__get_num_points()
+        ts = np.linspace(0, 1, num_points)
+        points = self.__sample_euler_function(num_points)
+        normals = _get_bend_normals(points, 0.0, self.turnby)
+
         if self.wgt.wg_type == "strip":
-            wg = gdspy.Path(self.start_width, (0, 0))
+            width = self.start_width + (self.end_width - self.start_width) * ts
+            distance = 0
         elif self.wgt.wg_type == "slot":
-            wg = gdspy.Path(
-                self.wgt.rail, (0, 0), number_of_paths=2, distance=self.wgt.rail_dist
-            )
-
-        wg.parametric(
-            self.__euler_function,
-            final_width=self.end_width,
-            tolerance=self.wgt.grid / 2.0,
-            max_points=199,
-            **self.wg_spec
-        )
-        self.add(wg)
+            width = self.wgt.rail + (self.end_width - self.wgt.rail) * ts
+            distance = self.wgt.rail_dist
+        for polygon in _get_bend_polygons(
+            points, normals, width, self.wg_spec, distance=distance
+        ):
+            self.add(polygon)
 
         # Add cladding
         for i in range(len(self.wgt.waveguide_stack) - 1):
@@ -272,15 +373,8 @@ class EBend(tk.Component):
                 "layer": self.wgt.waveguide_stack[i + 1][1][0],
                 "datatype": self.wgt.waveguide_stack[i + 1][1][1],
             }
-
-            clad = gdspy.Path(cur_width, (0, 0))
-            clad.parametric(
-                self.__euler_function,
-                tolerance=self.wgt.grid / 2.0,
-                max_points=199,
-                **cur_spec
-            )
-            self.add(clad)
+            for polygon in _get_bend_polygons(points, normals, cur_width, cur_spec):
+                self.add(polygon)
 
     def __build_ports(self):
         # Portlist format:
@@ -328,6 +422,11 @@ class EulerSBend(tk.Component):
         port=(0, 0),
         direction="EAST",
     ):
+        # Checked before the cell is registered, so a failed build never leaves an empty cell behind
+        if height == 0:
+            raise ValueError(
+                "Warning! The height of the S-bend must be nonzero (use a Waveguide instead)."
+            )
         tk.Component.__init__(self, "EulerSBend", locals())
 
         # Protected variables
@@ -369,25 +468,22 @@ class EulerSBend(tk.Component):
             4 * length
         )  # Length between the origin and the vertex (horizontally)
 
-        if abs(height) == length:  # Edge case to avoid divergent tangent values
-            self.turnby = np.pi / 2.0
-        else:
-            self.turnby = np.arctan(abs(height / 2) / (length / 2.0 - self.ls))
+        # arctan2 is well defined when abs(height) == length (a 90 degree turn)
+        self.turnby = np.arctan2(abs(height / 2), length / 2.0 - self.ls)
+        # (cos, sin) of the rotation by -turnby that places the middle sections of the S-bend
+        self.rotation = (math.cos(self.turnby), -math.sin(self.turnby))
 
         """ Compute Euler parameters, based on an obtuse angle Euler bend """
-        self.t = np.sqrt((2 / np.pi) * abs(self.turnby / 2.0))
-        dy, dx = fresnel(self.t)
-
-        output_x_norm = (
-            dx + dx * np.cos(abs(self.turnby)) - (-dy) * np.sin(abs(self.turnby))
-        )
-        output_y_norm = (
-            dy + dx * np.sin(abs(self.turnby)) + (-dy) * np.cos(abs(self.turnby))
-        )
+        self.t, output_x_norm, output_y_norm, _ = _get_euler_norm(abs(self.turnby))
 
         self.scale_factor = abs(height / 2.0) / (output_y_norm)
 
-        self.__build_cell()
+        if self.first_cell:
+            """ Only generate the geometry once for each unique set of parameters.
+            Identical bends are placed as references to the same cell, so the polygons
+            would be discarded anyway.
+            """
+            self.__build_cell()
         self.__build_ports()
 
         """ Translate & rotate the ports corresponding to this specific component object
@@ -396,15 +492,9 @@ class EulerSBend(tk.Component):
 
     def get_radius_of_curvature(self):
         """Returns the minimum radius of curvature used to construct the Euler S-Bend"""
-        t = self.t
-        # Returns the radius of curvature for a normalized Euler curve at a position t
-        xp = np.cos((np.pi * t ** 2) / 2.0)  # First derivative of x(t) (FresnelC)
-        yp = np.sin((np.pi * t ** 2) / 2.0)  # First derivative of y(t) (FresnelS)
-        xpp = -np.pi * t * np.sin((np.pi * t ** 2) / 2.0)  # Second derivative of x(t)
-        ypp = np.pi * t * np.cos((np.pi * t ** 2) / 2.0)  # Second derivative of y(t)
-        return self.scale_factor * abs(
-            ((xp ** 2 + yp ** 2) ** (3 / 2)) / (xp * ypp - yp * xpp)
-        )  # Radius of curvature: https://en.wikipedia.org/wiki/Radius_of_curvature
+        # The radius of curvature of the normalized Euler curve at the end-point t is 1 / (pi t), since
+        # |x'|^2 + |y'|^2 = 1 and x' y'' - y' x'' = pi t for the Fresnel curve (see EBend)
+        return self.scale_factor / (np.pi * self.t) if self.t != 0 else np.inf
 
     def get_bend_length(self):
         """Returns the length of the Euler S-Bend"""
@@ -412,71 +502,100 @@ class EulerSBend(tk.Component):
         return 4 * self.t * self.scale_factor
 
     def __euler_s_function(self, t):
-        # input (t) goes from 0->1
-        # Returns an (x,y) tuple
-        if t > 1.0 or t < 0.0:
+        # input (t) goes from 0->1, and can be a single value or a numpy array of values
+        # Returns a numpy array of the (x,y) points, with shape t.shape + (2,)
+        # The whole batch of t values is checked at once (the samplers only pass linspace(0, 1, N))
+        t = np.asarray(t, dtype=float)
+        if t.size > 0 and (t.min() < 0.0 or t.max() > 1.0):
             raise ValueError(
-                "Warning! A value was given to __euler_function not between 0 and 1"
+                "Warning! A value was given to __euler_s_function not between 0 and 1"
             )
 
         end_t = self.t  # (end-point)
+        first_transform, last_transform = _get_section_transforms(
+            self.rotation, self.scale_factor, self.sign
+        )
 
-        if t < 0.25:
-            y, x = fresnel(4 * t * end_t)
-            return x * self.scale_factor, self.sign * y * self.scale_factor
-        elif t < 0.5:
-            y, x = fresnel(4 * (0.5 - t) * end_t)
-            x, y = (
-                x * np.cos(-self.turnby) - y * np.sin(-self.turnby),
-                x * np.sin(-self.turnby) + y * np.cos(-self.turnby),
-            )
-            return (
-                self.output_port[0] / 2 - x * self.scale_factor,
-                self.output_port[1] / 2 + self.sign * y * self.scale_factor,
-            )
-        elif t < 0.75:
-            y, x = fresnel(4 * (t - 0.5) * end_t)
-            x, y = (
-                x * np.cos(-self.turnby) - y * np.sin(-self.turnby),
-                x * np.sin(-self.turnby) + y * np.cos(-self.turnby),
-            )
-            return (
-                self.output_port[0] / 2 + x * self.scale_factor,
-                self.output_port[1] / 2 - self.sign * y * self.scale_factor,
-            )
-        else:
-            y, x = fresnel(4 * (t - 1) * end_t)
-            return (
-                self.output_port[0] + x * self.scale_factor,
-                self.output_port[1] + self.sign * y * self.scale_factor,
-            )
+        # The S-bend is made of four Euler sections.  The Fresnel integrals for all of them are
+        # evaluated in a single call (on |t|, since the curve is odd), then each point picks the
+        # section (quarter) it belongs to.  The outer sections are the input/output sections of an
+        # Euler bend, and the middle sections are the rotated section of the same bend.
+        quarter = np.minimum((4 * t).astype(int), 3)
+        y, x = fresnel(
+            np.abs(np.choose(quarter, [4 * t, 2 - 4 * t, 4 * t - 2, 4 * t - 4])) * end_t
+        )
+        xy = np.stack((x, y), axis=-1)
+        outer = ((quarter == 0) | (quarter == 3))[..., np.newaxis]
+        section = np.where(
+            outer, np.dot(xy, first_transform), np.dot(xy, last_transform)
+        )
+
+        offset = np.choose(quarter, [0, 0.5, 0.5, 1.0])[..., np.newaxis]
+        section_sign = np.choose(quarter, [1, 1, -1, -1])[..., np.newaxis]
+        return offset * self.output_port + section_sign * section
+
+    def __get_num_points(self):
+        """Returns the number of (evenly spaced) values of t at which the Euler S-bend is sampled, such that
+        the polygon deviates from the true curve by less than half the grid size on the tightest bend.
+        """
+        # Sagitta of a chord of length ds on a circle of radius R:  ds**2 / (8 R) <= grid / 2
+        max_step = np.sqrt(4 * self.get_radius_of_curvature() * self.wgt.grid)
+        num_steps = max(int(np.ceil(self.get_bend_length() / max_step)), 2)
+        # A multiple of four steps puts a sample on each of the quarter points, so the four sections are congruent
+        return 4 * ((num_steps + 3) // 4) + 1
+
+    def __sample_euler_s_function(self, num_points):
+        """Returns the Euler S-bend at `num_points` evenly spaced values of t, i.e. the same (N,2) array as
+        `__euler_s_function(np.linspace(0, 1, num_points))`.  All four sections are rotated/mirrored copies of the
+        same Euler curve, so (when num_points - 1 is a multiple of four) the Fresnel integrals are only evaluated
+        on one section.
+        """
+        if (num_points - 1) % 4 != 0:
+            return self.__euler_s_function(np.linspace(0, 1, num_points))
+
+        num_quarter = (num_points - 1) // 4 + 1
+        y, x = fresnel(np.linspace(0, self.t, num_quarter))
+        xy = np.column_stack((x, y))
+        first_transform, last_transform = _get_section_transforms(
+            self.rotation, self.scale_factor, self.sign
+        )
+        outer, middle = np.dot(xy, first_transform), np.dot(xy, last_transform)
+        mid_port = 0.5 * np.array(self.output_port)
+
+        points = np.empty((num_points, 2))
+        n = num_quarter - 1
+        points[0 : n + 1] = outer
+        points[n : 2 * n + 1] = (mid_port + middle)[::-1]
+        points[2 * n : 3 * n + 1] = mid_port - middle
+        points[3 * n :] = (self.output_port - outer)[::-1]
+        return points
 
     def __build_cell(self):
-        # Sequentially build all the geometric shapes using gdspy path functions
+        # Sequentially build all the geometric shapes from the sampled Euler curve
         # for waveguide, then add it to the Cell
 
         # Uncomment below to plot the function (useful for debugging)
         #        import matplotlib.pyplot as plt
         #        tvals = np.linspace(0,1,5000)
-        #        xy = [self.__euler_s_function(tv) for tv in tvals]
-        #        plt.scatter(*zip(*xy))
+        #        plt.scatter(*self.__euler_s_function(tvals).T)
         #        plt.show()
 
+        # The Euler curve is evaluated once (vectorized), and every layer is traced from the same points
+        num_points = self.__get_num_points()
+        ts = np.linspace(0, 1, num_points)
+        points = self.__sample_euler_s_function(num_points)
+        normals = _get_bend_normals(points, 0.0, 0.0)
+
         if self.wgt.wg_type == "strip":
-            wg = gdspy.Path(self.start_width, (0, 0))
+            width = self.start_width + (self.end_width - self.start_width) * ts
+            distance = 0
         elif self.wgt.wg_type == "slot":
-            wg = gdspy.Path(
-                self.wgt.rail, (0, 0), number_of_paths=2, distance=self.wgt.rail_dist
-            )
-
-        wg.parametric(
-            self.__euler_s_function,
-            final_width=self.end_width,
-            tolerance=self.wgt.grid / 2.0,
-            max_points=199,
-            **self.wg_spec
-        )
-        self.add(wg)
+            width = self.wgt.rail + (self.end_width - self.wgt.rail) * ts
+            distance = self.wgt.rail_dist
+        for polygon in _get_bend_polygons(
+            points, normals, width, self.wg_spec, distance=distance
+        ):
+            self.add(polygon)
 
         # Add cladding
         for i in range(len(self.wgt.waveguide_stack) - 1):
@@ -485,15 +604,8 @@ class EulerSBend(tk.Component):
                 "layer": self.wgt.waveguide_stack[i + 1][1][0],
                 "datatype": self.wgt.waveguide_stack[i + 1][1][1],
             }
-
-            clad = gdspy.Path(cur_width, (0, 0))
-            clad.parametric(
-                self.__euler_s_function,
-                tolerance=self.wgt.grid / 2.0,
-                max_points=199,
-                **cur_spec
-            )
-            self.add(clad)
+            for polygon in _get_bend_polygons(points, normals, cur_width, cur_spec):
+                self.add(polygon)
 
     def __build_ports(self):
         # Portlist format:
@@ -6,6 +6,58 @@ import gdspy
 import picwriter.toolkit as tk
 
 
+def _get_rectangles(centers, half_sizes):
+    """Returns an (N,4,2) array with the vertices of N axis-aligned rectangles (in the same order as gdspy.Rectangle),
+    given their (N,2) `centers` and their half-widths along x and y, `half_sizes` (one (x,y) pair for all of them, or
+    an (N,2) array).  Used to batch many rectangles on the same layer into one gdspy.PolygonSet.
+    """
+    centers = np.asarray(centers, dtype=float).reshape(-1, 1, 2)
+    half_sizes = np.asarray(half_sizes, dtype=float).reshape(-1, 1, 2)
+    return centers + half_sizes * np.array([[-1, -1], [-1, 1], [1, 1], [1, -1]])
+
+
+def _get_route_plan(trace):
+    """Returns the lengths, cardinal directions and angles (in radians) of every segment of a Manhattan `trace` (a list
+    of (x,y) waypoints), along with the turn at every inner waypoint (+pi/2 for a counter-clockwise turn, -pi/2 for a
+    clockwise turn).  Everything is computed for the whole trace at once, so the routing only has to draw the path.
+    """
+    deltas = np.diff(np.array(trace, dtype=float), axis=0)
+    lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+    # Number of counter-clockwise quarter turns from 'EAST', for each segment
+    quarters = (
+        np.round(np.arctan2(deltas[:, 1], deltas[:, 0]) / (0.5 * np.pi)).astype(int) % 4
+    )
+    directions = [tk.CARDINAL_DIRECTIONS[q] for q in quarters]
+    angles = [tk.DIRECTION_TABLE[d][0] for d in directions]
+    turns = np.where(np.diff(quarters) % 4 == 1, np.pi / 2.0, -np.pi / 2.0)
+    return lengths, directions, angles, turns
+
+
+_TURNS = {}
+
+
+def _get_turn(width, radius, direction, angle):
+    """Returns the polygons of the turn of a gdspy.Path with the given `width` that starts at the origin, pointing
+    towards the cardinal `direction`, and turns by `angle` with `radius` (see gdspy.Path.turn), along with the (x,y)
+    position of the end of the turn.  Manhattan routes only ever make a handful of distinct turns, so each one is only
+    tessellated once.
+    """
+    key = (width, radius, direction, angle)
+    if key not in _TURNS:
+        if len(_TURNS) >= 256:
+            _TURNS.clear()
+        path = gdspy.Path(width, (0, 0))
+        path.turn(radius, angle, tolerance=0.1)
+        # Turned from 'EAST' to `direction`, which is exact since the cos and sin are 0 or +/-1
+        c, s = tk.DIRECTION_TABLE[direction][1:]
+        rotation = np.array([[c, s], [-s, c]])
+        _TURNS[key] = (
+            [np.dot(polygon, rotation) for polygon in path.polygons],
+            np.dot((path.x, path.y), rotation),
+        )
+    return _TURNS[key]
+
+
 class MetalTemplate:
     """Template for electrical wires that contains some standard information about the fabrication process and metal wire.
 
@@ -22,6 +74,21 @@ class MetalTemplate:
 
     """
 
+    __slots__ = (
+        "name",
+        "width",
+        "bend_radius",
+        "clad_width",
+        "resist",
+        "metal_layer",
+        "metal_datatype",
+        "clad_layer",
+        "clad_datatype",
+        "half_width",
+        "outer_width",
+        "clad_offset",
+    )
+
     def __init__(
         self,
         bend_radius=0,
@@ -54,6 +121,12 @@ class MetalTemplate:
         self.clad_layer = clad_layer
         self.clad_datatype = clad_datatype
 
+        # Widths derived from the above, used when drawing metal routes (the cladding extends
+        # clad_width past each edge of the metal)
+        self.half_width = width / 2.0
+        self.outer_width = width + 2 * clad_width
+        self.clad_offset = self.half_width + clad_width
+
 
 class MetalRoute(tk.Component):
     """Standard MetalRoute Cell class.
@@ -89,232 +162,129 @@ class MetalRoute(tk.Component):
         }  # Used for 'xor' operation
 
         self.__type_check_trace()
-        self.__build_cell()
+        if self.first_cell:
+            """ Only generate the geometry once for each unique trace and MetalTemplate.
+            Repeated routes are placed as references to the same cell.
+            """
+            self.__build_cell()
         self.__build_ports()
 
     def __type_check_trace(self):
-        trace = []
         """ Round each trace value to the nearest 1e-6 -- prevents
         some typechecking errors
         """
-        for t in self.trace:
-            trace.append((round(t[0], 6), round(t[1], 5)))
-        self.trace = trace
+        # x is rounded to 1e-6 and y to 1e-5 (np.rint of the scaled trace, both columns at once)
+        scales = np.array([1e6, 1e5])
+        trace = np.rint(np.array(self.trace, dtype=float) * scales) / scales
+        self.trace = [tuple(t) for t in trace.tolist()]
 
         """ Make sure that each waypoint is spaced > 2*bend_radius apart
         as a conservative estimate ¯\_(ツ)_/¯
         Make sure all waypoints specify 90degree angles.  This might be
         updated in the future to allow for 45deg, or arbitrary bends
         """
-        prev_dx, prev_dy = 1, 1  # initialize to safe value
-        for i in range(len(self.trace) - 1):
-            dx = abs(self.trace[i + 1][0] - self.trace[i][0]) + 1e-10
-            dy = abs(self.trace[i + 1][1] - self.trace[i][1]) + 1e-10
-            if (
-                (dx < 2 * self.mt.bend_radius and dy < 2 * self.mt.bend_radius)
-                and (i != 0)
-                and (i != len(self.trace) - 2)
-                and (self.bend_radius != 0)
-            ):
+        # (dx, dy) of every segment, so each check below is done on the whole trace at once
+        dx, dy = (np.abs(np.diff(trace, axis=0)) + 1e-10).T
+        br = self.mt.bend_radius
+        if self.bend_radius != 0 and len(dx) > 0:
+            if np.any((dx[1:-1] < 2 * br) & (dy[1:-1] < 2 * br)):
                 raise ValueError(
                     "Warning!  All waypoints *must* be greater than "
                     "two bend radii apart."
                 )
-            if (
-                ((i == 0) or (i == len(self.trace) - 2))
-                and (dx < self.mt.bend_radius and dy < self.mt.bend_radius)
-                and (self.bend_radius != 0)
-            ):
+            if np.any((dx[[0, -1]] < br) & (dy[[0, -1]] < br)):
                 raise ValueError(
                     "Warning! Start and end waypoints *must be greater "
                     "than one bend radius apart."
                 )
-            if dx >= 1e-6 and dy >= 1e-6:
-                raise ValueError(
-                    "Warning! All waypoints *must* specify turns " "that are 90degrees"
-                )
-            if (prev_dx <= 1e-6 and dx <= 1e-6) or (prev_dy <= 1e-6 and dy <= 1e-6):
-                raise ValueError(
-                    "Warning! Unnecessary waypoint specified.  All"
-                    " waypoints must specify a valid 90deg bend"
-                )
-            prev_dx, prev_dy = dx, dy
+        if np.any((dx >= 1e-6) & (dy >= 1e-6)):
+            raise ValueError(
+                "Warning! All waypoints *must* specify turns " "that are 90degrees"
+            )
+        # Two consecutive segments along the same axis means the waypoint between them is not a bend
+        no_dx, no_dy = dx <= 1e-6, dy <= 1e-6
+        if np.any(no_dx[:-1] & no_dx[1:]) or np.any(no_dy[:-1] & no_dy[1:]):
+            raise ValueError(
+                "Warning! Unnecessary waypoint specified.  All"
+                " waypoints must specify a valid 90deg bend"
+            )
 
     def __build_cell(self):
         # Sequentially build all the geometric shapes using gdspy path functions
         # for waveguide, then add it to the Cell
         br = self.mt.bend_radius
 
-        path = gdspy.Path(self.mt.width, self.trace[0])
-        path2 = gdspy.Path(self.mt.width + 2 * self.mt.clad_width, self.trace[0])
-
-        prior_direction = tk.get_direction(self.trace[0], self.trace[1])
+        lengths, directions, angles, turns = _get_route_plan(self.trace)
+        elements = []  # Everything is added to the cell at once, at the end
 
-        if br != 0:
+        if br != 0 and not (len(self.trace) == 2 and lengths[0] <= br):
             """ Path routing for curved bends.  Same as in waveguide class. """
-            path.segment(
-                tk.dist(self.trace[0], self.trace[1]) - br,
-                direction=tk.get_angle(self.trace[0], self.trace[1]),
-                **self.spec
-            )
-            path2.segment(
-                tk.dist(self.trace[0], self.trace[1]) - br,
-                direction=tk.get_angle(self.trace[0], self.trace[1]),
-                **self.clad_spec
-            )
-            for i in range(len(self.trace) - 2):
-                direction = tk.get_direction(self.trace[i + 1], self.trace[i + 2])
-                turn = tk.get_turn(prior_direction, direction)
-                path.turn(br, turn, number_of_points=0.1, **self.spec)
-                path2.turn(br, turn, number_of_points=0.1, **self.clad_spec)
-                if (
-                    tk.dist(self.trace[i + 1], self.trace[i + 2]) - 2 * br > 0
-                ):  # ONLY False for last points if spaced br < distance < 2br
-                    path.segment(
-                        tk.dist(self.trace[i + 1], self.trace[i + 2]) - 2 * br,
-                        **self.spec
+            for width, spec in [
+                (self.mt.width, self.spec),
+                (self.mt.outer_width, self.clad_spec),
+            ]:
+                path = gdspy.Path(width, self.trace[0])
+                path.segment(lengths[0] - br, direction=angles[0], **spec)
+                for i in range(len(self.trace) - 2):
+                    # The turn is copied from the cache, and the route goes on with a new path from its end
+                    polygons, end = _get_turn(width, br, directions[i], float(turns[i]))
+                    start = (path.x, path.y)
+                    elements.append(path)
+                    elements.append(
+                        gdspy.PolygonSet([p + start for p in polygons], **spec)
                     )
-                    path2.segment(
-                        tk.dist(self.trace[i + 1], self.trace[i + 2]) - 2 * br,
-                        **self.clad_spec
-                    )
-                prior_direction = direction
-            if tk.dist(self.trace[-2], self.trace[-1]) < 2 * br:
-                path.segment(tk.dist(self.trace[-2], self.trace[-1]) - br, **self.spec)
-                path2.segment(
-                    tk.dist(self.trace[-2], self.trace[-1]) - br, **self.clad_spec
-                )
-            else:
-                path.segment(br, **self.spec)
-                path2.segment(br, **self.clad_spec)
-
-            if (
-                len(self.trace) == 2
-                and tk.dist(self.trace[1], self.trace[0]) <= self.mt.bend_radius
-            ):
-                path = gdspy.Path(self.mt.width, self.trace[0])
-                path.segment(
-                    tk.dist(self.trace[0], self.trace[1]),
-                    direction=tk.get_angle(self.trace[0], self.trace[1]),
-                    **self.spec
-                )
-                path2 = gdspy.Path(
-                    self.mt.width + 2 * self.mt.clad_width, self.trace[0]
-                )
-                path2.segment(
-                    tk.dist(self.trace[0], self.trace[1]),
-                    direction=tk.get_angle(self.trace[0], self.trace[1]),
-                    **self.clad_spec
-                )
-        elif br == 0:
-            """ Do path routing for sharp 90 degree trace bends """
-            path.segment(
-                tk.dist(self.trace[0], self.trace[1]),
-                direction=tk.get_angle(self.trace[0], self.trace[1]),
-                **self.spec
-            )
-            path2.segment(
-                tk.dist(self.trace[0], self.trace[1]),
-                direction=tk.get_angle(self.trace[0], self.trace[1]),
-                **self.clad_spec
-            )
-            for i in range(len(self.trace) - 2):
-                """ Add a square to fill in the corner """
-                self.add(
-                    gdspy.Rectangle(
-                        (
-                            self.trace[i + 1][0] - self.mt.width / 2.0,
-                            self.trace[i + 1][1] - self.mt.width / 2.0,
-                        ),
-                        (
-                            self.trace[i + 1][0] + self.mt.width / 2.0,
-                            self.trace[i + 1][1] + self.mt.width / 2.0,
-                        ),
+                    path = gdspy.Path(width, (start[0] + end[0], start[1] + end[1]))
+                    if (
+                        lengths[i + 1] - 2 * br > 0
+                    ):  # ONLY False for last points if spaced br < distance < 2br
+                        path.segment(
+                            lengths[i + 1] - 2 * br, direction=angles[i + 1], **spec
+                        )
+                if lengths[-1] < 2 * br:
+                    path.segment(lengths[-1] - br, direction=angles[-1], **spec)
+                else:
+                    path.segment(br, direction=angles[-1], **spec)
+                elements.append(path)
+        else:
+            """ Do path routing for sharp 90 degree trace bends (also used for a single
+            segment that is too short to be trimmed by the bend radius)
+            """
+            path = gdspy.Path(self.mt.width, self.trace[0])
+            path2 = gdspy.Path(self.mt.outer_width, self.trace[0])
+            path.segment(lengths[0], direction=angles[0], **self.spec)
+            path2.segment(lengths[0], direction=angles[0], **self.clad_spec)
+            """ Add a square to fill in each corner (all at once) """
+            corners = self.trace[1:-1]
+            if len(corners) > 0:
+                half_width, clad_offset = self.mt.half_width, self.mt.clad_offset
+                elements.append(
+                    gdspy.PolygonSet(
+                        list(_get_rectangles(corners, (half_width, half_width))),
                         **self.spec
                     )
                 )
-                self.add(
-                    gdspy.Rectangle(
-                        (
-                            self.trace[i + 1][0]
-                            - self.mt.width / 2.0
-                            - self.mt.clad_width,
-                            self.trace[i + 1][1]
-                            - self.mt.width / 2.0
-                            - self.mt.clad_width,
-                        ),
-                        (
-                            self.trace[i + 1][0]
-                            + self.mt.width / 2.0
-                            + self.mt.clad_width,
-                            self.trace[i + 1][1]
-                            + self.mt.width / 2.0
-                            + self.mt.clad_width,
-                        ),
+                elements.append(
+                    gdspy.PolygonSet(
+                        list(_get_rectangles(corners, (clad_offset, clad_offset))),
                         **self.clad_spec
                     )
                 )
-                angle = tk.get_angle(self.trace[i + 1], self.trace[i + 2])
-                path.segment(
-                    tk.dist(self.trace[i + 1], self.trace[i + 2]),
-                    direction=angle,
-                    **self.spec
-                )
-                path2.segment(
-                    tk.dist(self.trace[i + 1], self.trace[i + 2]),
-                    direction=angle,
-                    **self.clad_spec
-                )
-
-        """ Extra padding """
-        if (
-            tk.get_direction(self.trace[0], self.trace[1]) == "EAST"
-            or tk.get_direction(self.trace[0], self.trace[1]) == "WEST"
-        ):
-            pad_ll = (
-                self.trace[0][0] - self.mt.clad_width,
-                self.trace[0][1] - self.mt.width / 2.0 - self.mt.clad_width,
-            )
-            pad_ul = (
-                self.trace[0][0] + self.mt.clad_width,
-                self.trace[0][1] + self.mt.width / 2.0 + self.mt.clad_width,
-            )
-        else:
-            pad_ll = (
-                self.trace[0][0] - self.mt.width / 2.0 - self.mt.clad_width,
-                self.trace[0][1] - self.mt.clad_width,
-            )
-            pad_ul = (
-                self.trace[0][0] + self.mt.width / 2.0 + self.mt.clad_width,
-                self.trace[0][1] + self.mt.clad_width,
-            )
-        self.add(gdspy.Rectangle(pad_ll, pad_ul, **self.clad_spec))
-
-        if (
-            tk.get_direction(self.trace[-2], self.trace[-1]) == "EAST"
-            or tk.get_direction(self.trace[-2], self.trace[-1]) == "WEST"
-        ):
-            pad_ll = (
-                self.trace[-1][0] - self.mt.clad_width,
-                self.trace[-1][1] - self.mt.width / 2.0 - self.mt.clad_width,
-            )
-            pad_ul = (
-                self.trace[-1][0] + self.mt.clad_width,
-                self.trace[-1][1] + self.mt.width / 2.0 + self.mt.clad_width,
-            )
-        else:
-            pad_ll = (
-                self.trace[-1][0] - self.mt.width / 2.0 - self.mt.clad_width,
-                self.trace[-1][1] - self.mt.clad_width,
-            )
-            pad_ul = (
-                self.trace[-1][0] + self.mt.width / 2.0 + self.mt.clad_width,
-                self.trace[-1][1] + self.mt.clad_width,
-            )
-        self.add(gdspy.Rectangle(pad_ll, pad_ul, **self.clad_spec))
-
-        self.add(path)
-        self.add(path2)
+            for i in range(len(self.trace) - 2):
+                path.segment(lengths[i + 1], direction=angles[i + 1], **self.spec)
+                path2.segment(lengths[i + 1], direction=angles[i + 1], **self.clad_spec)
+            elements += [path, path2]
+
+        """ Extra padding at both ends of the route (added at once) """
+        half_sizes = [
+            (self.mt.clad_width, self.mt.clad_offset)
+            if direction == "EAST" or direction == "WEST"
+            else (self.mt.clad_offset, self.mt.clad_width)
+            for direction in (directions[0], directions[-1])
+        ]
+        pads = _get_rectangles([self.trace[0], self.trace[-1]], half_sizes)
+        elements.append(gdspy.PolygonSet(list(pads), **self.clad_spec))
+
+        self.add(elements)
 
     def __build_ports(self):
         # Portlist format:
@@ -365,7 +335,11 @@ class Bondpad(tk.Component):
         self.spec = {"layer": mt.metal_layer, "datatype": mt.metal_datatype}
         self.clad_spec = {"layer": mt.clad_layer, "datatype": mt.clad_datatype}
 
-        self.__build_cell()
+        if self.first_cell:
+            """ Only generate the geometry once for each unique bondpad size and MetalTemplate
+            (the port and direction only set where the reference is placed).
+            """
+            self.__build_cell()
         self.__build_ports()
 
         """ Translate & rotate the ports corresponding to this specific component object
@@ -376,9 +350,13 @@ class Bondpad(tk.Component):
         # Sequentially build all the geometric shapes using gdspy path functions
         # for waveguide, then add it to the Cell
         w, l, c = self.width, self.length, self.mt.clad_width
-        self.add(gdspy.Rectangle((0, -w / 2.0), (l, w / 2.0), **self.spec))
         self.add(
-            gdspy.Rectangle((-c, -w / 2.0 - c), (l + c, w / 2.0 + c), **self.clad_spec)
+            [
+                gdspy.Rectangle((0, -w / 2.0), (l, w / 2.0), **self.spec),
+                gdspy.Rectangle(
+                    (-c, -w / 2.0 - c), (l + c, w / 2.0 + c), **self.clad_spec
+                ),
+            ]
         )
 
     def __build_ports(self):
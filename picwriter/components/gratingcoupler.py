@@ -1,10 +1,139 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
+import math
 import numpy as np
 import gdspy
 import picwriter.toolkit as tk
 
 
+def _get_linspace(start, stop, num, index):
+    """Returns element `index` of np.linspace(start, stop, num), where all the arguments can be arrays (so that many
+    ranges of different lengths can be evaluated at once, with exactly the same values as np.linspace)."""
+    step = (stop - start) / np.maximum(num - 1, 1)
+    return np.where(index == num - 1, stop, index * step + start)
+
+
+def _get_tooth_polygons(inner_rads, outer_rads, num_points, theta, max_points=199):
+    """Returns the polygons of the annular sectors (grating teeth) between the arrays `inner_rads` and `outer_rads`,
+    centered at the origin and spanning the angles -theta/2 to +theta/2, with `num_points` (an array) vertices each.
+    These are the same polygons as `gdspy.Round` makes (including splitting teeth with more than `max_points` vertices
+    into pieces), but the vertices of all the teeth are computed at once.
+    """
+    num_points = np.asarray(num_points)
+    if len(num_points) == 0:
+        return []
+
+    # Every tooth is split into pieces (usually one) with the same number of vertices, as in gdspy.Round
+    pieces = np.ceil(num_points / float(max_points)).astype(int)
+    tooth = np.repeat(np.arange(len(num_points)), pieces)
+    piece = np.arange(len(tooth)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    n_piece = (num_points // pieces)[tooth]
+    n_inner = n_piece // 2
+    n_outer = n_piece - n_inner
+    half_theta = theta / 2.0
+    start_angle = _get_linspace(-half_theta, half_theta, pieces[tooth] + 1, piece)
+    end_angle = _get_linspace(-half_theta, half_theta, pieces[tooth] + 1, piece + 1)
+
+    # Each piece traces its outer arc (counter-clockwise), then its inner arc (clockwise)
+    vertex_piece = np.repeat(np.arange(len(tooth)), n_piece)
+    index = np.arange(len(vertex_piece)) - np.repeat(
+        np.cumsum(n_piece) - n_piece, n_piece
+    )
+    outer = index < n_outer[vertex_piece]
+    start_angle, end_angle = start_angle[vertex_piece], end_angle[vertex_piece]
+    angle = np.where(
+        outer,
+        _get_linspace(start_angle, end_angle, n_outer[vertex_piece], index),
+        _get_linspace(
+            end_angle,
+            start_angle,
+            n_inner[vertex_piece],
+            index - n_outer[vertex_piece],
+        ),
+    )
+    radius = np.where(
+        outer, outer_rads[tooth][vertex_piece], inner_rads[tooth][vertex_piece]
+    )
+    vertices = np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+    return np.split(vertices, np.cumsum(n_piece)[:-1])
+
+
+_UNIT_SECTORS = {}
+
+
+def _get_unit_sector(num_points, half_theta, max_points=199):
+    """Returns the polygons (as a read-only (pieces, N, 2) array) of a gdspy.Round sector of unit radius centered at the
+    origin, spanning the angles -half_theta to +half_theta with `num_points` vertices.  Scaling the array by a radius
+    gives exactly the polygons of the gdspy.Round with that radius, so sectors of different radii (and every coupler
+    with the same angle and taper) share the trig evaluations.
+    """
+    key = (num_points, half_theta, max_points)
+    if key in _UNIT_SECTORS:
+        return _UNIT_SECTORS[key]
+    if len(_UNIT_SECTORS) >= 128:
+        _UNIT_SECTORS.clear()
+    pieces = int(np.ceil(num_points / float(max_points)))
+    num_points = num_points // pieces
+    angles = np.linspace(-half_theta, half_theta, pieces + 1)
+    sector = np.zeros((pieces, num_points, 2))
+    for ii in range(pieces):
+        t = np.linspace(angles[ii], angles[ii + 1], num_points - 1)
+        sector[ii, 1:, 0] = np.cos(t)
+        sector[ii, 1:, 1] = np.sin(t)
+    sector.flags.writeable = False
+    _UNIT_SECTORS[key] = sector
+    return sector
+
+
+def _get_clad_polygon(start_width, taper_length, end_width, length, **kwargs):
+    """Returns the gdspy.Polygon (starting at the origin and pointing in +x) of a linear taper from `start_width` to
+    `end_width` over `taper_length`, followed by a straight section of `length`.  This is the outline of a gdspy.Path
+    with those two segments, as one polygon instead of two.
+    """
+    a, b = 0.5 * start_width, 0.5 * end_width
+    x1, x2 = taper_length, taper_length + length
+    return gdspy.Polygon(
+        [(0, -a), (x1, -b), (x2, -b), (x2, b), (x1, b), (0, a)], **kwargs
+    )
+
+
+def _get_clockwise_quarter_turn(polygons):
+    """Returns `polygons` (a list of (N,2) arrays) rotated by -pi/2 about the origin, (x, y) -> (y, -x).  All the
+    vertices are turned as one array, and swapping the coordinates is exact (where gdspy's rotate goes through the
+    cos/sin of the angle for every polygon).
+    """
+    if len(polygons) == 0:
+        return []
+    vertices = np.concatenate(polygons)
+    turned = np.empty_like(vertices)
+    turned[:, 0] = vertices[:, 1]
+    turned[:, 1] = -vertices[:, 0]
+    return np.split(turned, np.cumsum([len(polygon) for polygon in polygons[:-1]]))
+
+
+def _get_curve_polygons(points, tangents, width, max_points=199):
+    """Returns the polygons of paths of the given `width` along the curves `points` (an array of shape (curves, N, 2)),
+    with the (not necessarily unit) `tangents` of the curves at those points.  As in gdspy.Path.parametric, every path
+    is split into pieces of max_points//2 points along the curve, so no polygon has more than `max_points` vertices.
+    """
+    normals = tangents[..., ::-1] * (-1.0, 1.0)
+    normals *= (0.5 * width) / np.hypot(tangents[..., 0], tangents[..., 1])[
+        ..., np.newaxis
+    ]
+    left, right = points + normals, (points - normals)[:, ::-1]
+    num = points.shape[1]
+    polygons = []
+    for curve in range(len(points)):
+        i0 = 0
+        while i0 < num - 1:
+            i1 = min(i0 + max_points // 2, num)
+            polygons.append(
+                np.concatenate((left[curve, i0:i1], right[curve, num - i1 : num - i0]))
+            )
+            i0 = i1 - 1
+    return polygons
+
+
 class GratingCoupler(tk.Component):
     """Typical Grating Coupler Cell class.
 
@@ -34,6 +163,21 @@ class GratingCoupler(tk.Component):
 
     """
 
+    __slots__ = (
+        "wgt",
+        "theta",
+        "length",
+        "taper_length",
+        "period",
+        "dc",
+        "ridge",
+        "ridge_layers",
+        "teeth_list",
+        "teeth",
+        "wg_spec",
+        "clad_spec",
+    )
+
     def __init__(
         self,
         wgt,
@@ -70,12 +214,19 @@ class GratingCoupler(tk.Component):
 
         self.teeth_list = teeth_list
         if teeth_list != None:
-            self.length = self.taper_length + sum([l[0] + l[1] for l in teeth_list])
+            # (gap, width) of every tooth, parsed once for the total length and the tooth radii
+            self.teeth = np.array(teeth_list, dtype=float).reshape(-1, 2)
+            self.length = self.taper_length + float(np.sum(self.teeth))
 
         self.wg_spec = {"layer": wgt.wg_layer, "datatype": wgt.wg_datatype}
         self.clad_spec = {"layer": wgt.clad_layer, "datatype": wgt.clad_datatype}
 
-        self.__build_cell()
+        if self.first_cell:
+            """ Only generate the geometry once for each unique set of parameters.
+            Identical couplers are placed as references to the same cell, so the polygons
+            would be discarded anyway.
+            """
+            self.__build_cell()
         self.__build_ports()
 
         """ Translate & rotate the ports corresponding to this specific component object
@@ -86,94 +237,65 @@ class GratingCoupler(tk.Component):
         # Sequentially build all the geometric shapes using gdspy path functions
         # then add it to the Cell
         """Create a straight grating GratingCoupler"""
-
-        # First the input taper
-        taper = gdspy.Round(
-            (0, 0),
-            radius=self.taper_length,
-            inner_radius=0,
-            initial_angle=-self.theta / 2.0,
-            final_angle=+self.theta / 2.0,
-            number_of_points=self.wgt.get_num_points_curve(
-                self.theta, self.taper_length
-            )
-            + 1,
-            **self.wg_spec
+        half_theta = 0.5 * self.theta
+        elements = []  # Everything is added to the cell at once, at the end
+
+        # First the input taper.  The taper and the ridge region are sectors with the same angles and number of
+        # points, so they are both scaled from one unit sector.
+        sector = _get_unit_sector(
+            self.wgt.get_num_points_curve(self.theta, self.taper_length) + 1,
+            half_theta,
         )
+        taper = gdspy.PolygonSet(list(sector * self.taper_length), **self.wg_spec)
 
         if self.ridge:
-            ridge_region = gdspy.Round(
-                (0, 0),
-                radius=self.length,
-                inner_radius=0,
-                initial_angle=-self.theta / 2.0,
-                final_angle=+self.theta / 2.0,
-                number_of_points=self.wgt.get_num_points_curve(
-                    self.theta, self.taper_length
-                )
-                + 1,
+            ridge_region = gdspy.PolygonSet(
+                list(sector * self.length),
                 layer=self.ridge_layers[0],
                 datatype=self.ridge_layers[1],
             )
-            self.add(ridge_region)
+            elements.append(ridge_region)
 
         # Then the input waveguide stub
         if self.taper_length > self.wgt.wg_width / 2:
-            stub_length = (self.wgt.wg_width / 2.0) / np.tan(self.theta / 2.0)
+            stub_length = (self.wgt.wg_width / 2.0) / math.tan(half_theta)
             stub = gdspy.Path(self.wgt.wg_width, (0, 0))
             stub.segment(stub_length + 0.1, **self.wg_spec)
-            self.add(stub)
+            elements.append(stub)
 
+        # Inner and outer radius of every tooth, computed for all the teeth at once
         if self.teeth_list == None:
             """ Fixed pitch grating coupler """
             num_teeth = int((self.length - self.taper_length) // self.period)
             gap = self.period - (self.period * self.dc)
-            for i in range(num_teeth):
-                inner_rad = self.taper_length + i * self.period + gap
-                outer_rad = self.taper_length + (i + 1) * self.period
-                line = gdspy.Round(
-                    (0, 0),
-                    radius=outer_rad,
-                    inner_radius=inner_rad,
-                    initial_angle=-self.theta / 2.0,
-                    final_angle=+self.theta / 2.0,
-                    number_of_points=2
-                    * self.wgt.get_num_points_curve(self.theta, outer_rad),
-                    **self.wg_spec
-                )
-                self.add(line)
+            i = np.arange(num_teeth)
+            inner_rads = self.taper_length + i * self.period + gap
+            outer_rads = self.taper_length + (i + 1) * self.period
         else:
             """ User specified gap/width grating coupler """
-            cur_pos = self.taper_length
-            for i in range(len(self.teeth_list)):
-                (gap, width) = self.teeth_list[i]
-                inner_rad = cur_pos + gap
-                outer_rad = cur_pos + gap + width
-                line = gdspy.Round(
-                    (0, 0),
-                    radius=outer_rad,
-                    inner_radius=inner_rad,
-                    initial_angle=-self.theta / 2.0,
-                    final_angle=+self.theta / 2.0,
-                    number_of_points=2
-                    * self.wgt.get_num_points_curve(self.theta, outer_rad),
-                    **self.wg_spec
-                )
-                self.add(line)
-                cur_pos = outer_rad
-
-        clad_path = gdspy.Path(self.wgt.wg_width + 2 * self.wgt.clad_width, (0, 0))
-        clad_path.segment(
+            outer_rads = self.taper_length + np.cumsum(
+                self.teeth[:, 0] + self.teeth[:, 1]
+            )
+            inner_rads = outer_rads - self.teeth[:, 1]
+        num_points = 2 * self.wgt.get_num_points_curve(self.theta, outer_rads)
+
+        elements.append(
+            gdspy.PolygonSet(
+                _get_tooth_polygons(inner_rads, outer_rads, num_points, self.theta),
+                **self.wg_spec
+            )
+        )
+
+        clad_path = _get_clad_polygon(
+            self.wgt.wg_width + 2 * self.wgt.clad_width,
             self.length,
-            direction="+x",
-            final_width=2 * np.sin(self.theta / 2.0) * self.length
-            + 2 * self.wgt.clad_width,
+            2 * math.sin(half_theta) * self.length + 2 * self.wgt.clad_width,
+            self.wgt.clad_width,
             **self.clad_spec
         )
-        clad_path.segment(self.wgt.clad_width, **self.clad_spec)
 
-        self.add(taper)
-        self.add(clad_path)
+        elements += [taper, clad_path]
+        self.add(elements)
 
     def __build_ports(self):
         # Portlist format:
@@ -207,6 +329,18 @@ class GratingCouplerStraight(tk.Component):
 
     """
 
+    __slots__ = (
+        "wgt",
+        "resist",
+        "width",
+        "length",
+        "taper_length",
+        "period",
+        "dc",
+        "wg_spec",
+        "clad_spec",
+    )
+
     def __init__(
         self,
         wgt,
@@ -239,7 +373,12 @@ class GratingCouplerStraight(tk.Component):
         self.wg_spec = {"layer": wgt.wg_layer, "datatype": wgt.wg_datatype}
         self.clad_spec = {"layer": wgt.clad_layer, "datatype": wgt.clad_datatype}
 
-        self.__build_cell()
+        if self.first_cell:
+            """ Only generate the geometry once for each unique set of parameters.
+            Identical couplers are placed as references to the same cell, so the polygons
+            would be discarded anyway.
+            """
+            self.__build_cell()
         self.__build_ports()
 
         """ Translate & rotate the ports corresponding to this specific component object
@@ -257,32 +396,28 @@ class GratingCouplerStraight(tk.Component):
         path.segment(
             self.taper_length, direction="+x", final_width=self.width, **self.wg_spec
         )
-        teeth = gdspy.L1Path(
-            (
-                gap + self.taper_length + 0.5 * (num_teeth - 1 + self.dc) * self.period,
-                -0.5 * self.width,
-            ),
-            "+y",
-            self.period * self.dc,
-            [self.width],
-            [],
-            num_teeth,
-            self.period,
-            **self.wg_spec
-        )
-
-        clad_path = gdspy.Path(self.wgt.wg_width + 2 * self.wgt.clad_width, (0, 0))
-        clad_path.segment(
+        # The teeth are num_teeth rectangles spaced by one period (the same polygons as gdspy.L1Path would make for
+        # num_teeth parallel paths), all built at once
+        x0 = gap + self.taper_length + 0.5 * (num_teeth - 1 + self.dc) * self.period
+        y0 = -0.5 * self.width
+        d0 = (num_teeth - 1) * self.period * 0.5 - np.arange(num_teeth) * self.period
+        w = self.period * self.dc * 0.5
+        rectangles = np.empty((num_teeth, 4, 2))
+        rectangles[:, :2, 0] = (d0 + x0 + w)[:, np.newaxis]
+        rectangles[:, 2:, 0] = (d0 + x0 - w)[:, np.newaxis]
+        rectangles[:, (0, 3), 1] = y0
+        rectangles[:, (1, 2), 1] = y0 + self.width
+        teeth = gdspy.PolygonSet(list(rectangles), **self.wg_spec)
+
+        clad_path = _get_clad_polygon(
+            self.wgt.wg_width + 2 * self.wgt.clad_width,
             self.taper_length,
-            direction="+x",
-            final_width=self.width + 2 * self.wgt.clad_width,
+            self.width + 2 * self.wgt.clad_width,
+            self.length,
             **self.clad_spec
         )
-        clad_path.segment(self.length, direction="+x", **self.clad_spec)
 
-        self.add(teeth)
-        self.add(path)
-        self.add(clad_path)
+        self.add([teeth, path, clad_path])
 
     def __build_ports(self):
         # Portlist format:
@@ -306,7 +441,7 @@ class GratingCouplerFocusing(tk.Component):
        * **dutycycle** (float): dutycycle, determines the size of the 'gap' by dutycycle=(period-gap)/period.
        * **wavelength** (float): free space wavelength of the light
        * **sin_theta** (float): sine of the incident angle
-       * **evaluations** (int): number of parameteric evaluations of path.parametric
+       * **evaluations** (int): number of points at which each tooth curve is evaluated (the points are doubled until the teeth are within 0.01 of the curves)
 
     Members:
        **portlist** (dict): Dictionary with the relevant port information
@@ -319,6 +454,21 @@ class GratingCouplerFocusing(tk.Component):
 
     """
 
+    __slots__ = (
+        "wgt",
+        "resist",
+        "focus_distance",
+        "width",
+        "length",
+        "period",
+        "dc",
+        "wavelength",
+        "sin_theta",
+        "evaluations",
+        "wg_spec",
+        "clad_spec",
+    )
+
     def __init__(
         self,
         wgt,
@@ -351,13 +501,22 @@ class GratingCouplerFocusing(tk.Component):
                 "Warning! Dutycycle *must* specify a valid number " "between 0 and 1."
             )
         self.dc = dutycycle
+        if focus_distance < width / 2.0 - period:
+            raise ValueError(
+                "Warning! The focus_distance is smaller than the allowed value of width/2.0 - period."
+            )
         self.wavelength = wavelength
         self.sin_theta = sin_theta
         self.evaluations = evaluations
         self.wg_spec = {"layer": wgt.wg_layer, "datatype": wgt.wg_datatype}
         self.clad_spec = {"layer": wgt.clad_layer, "datatype": wgt.clad_datatype}
 
-        self.__build_cell()
+        if self.first_cell:
+            """ Only generate the geometry once for each unique set of parameters.
+            Identical couplers are placed as references to the same cell, so the polygons
+            would be discarded anyway.
+            """
+            self.__build_cell()
         self.__build_ports()
 
         """ Translate & rotate the ports corresponding to this specific component object
@@ -368,62 +527,73 @@ class GratingCouplerFocusing(tk.Component):
         # Sequentially build all the geometric shapes using gdspy path functions
         # then add it to the Cell
 
+        # Bound to locals once, the tooth curves below only read these (and never self)
+        width = self.width
+        wavelength = self.wavelength
+        sin_theta = self.sin_theta
+        evaluations = self.evaluations
+        wg_spec = self.wg_spec
+
         num_teeth = int(self.length // self.period)
-        if self.focus_distance < self.width / 2.0 - self.period:
-            raise ValueError(
-                "Warning! The focus_distance is smaller than the allowed value of width/2.0 - period."
-            )
-        neff = self.wavelength / float(self.period) + self.sin_theta
+        neff = wavelength / float(self.period) + sin_theta
         qmin = int(self.focus_distance / float(self.period) + 0.5)
         max_points = 199
-        c3 = neff ** 2 - self.sin_theta ** 2
-        w = 0.5 * self.width
-        path = gdspy.Path(
-            self.wgt.clad_width,
-            (0, 0),
-            number_of_paths=2,
-            distance=self.wgt.wg_width + self.wgt.clad_width,
-        )
-
-        teeth = gdspy.Path(self.period * self.dc, (0, 0))
-        for q in range(qmin, qmin + num_teeth):
-            c1 = q * self.wavelength * self.sin_theta
-            c2 = (q * self.wavelength) ** 2
-            teeth.parametric(
-                lambda t: (
-                    self.width * t - w,
-                    (c1 + neff * np.sqrt(c2 - c3 * (self.width * t - w) ** 2)) / c3,
-                ),
-                number_of_evaluations=self.evaluations,
-                max_points=max_points,
-                **self.wg_spec
-            )
-            teeth.x = 0
-            teeth.y = 0
-        teeth.polygons[0] = np.vstack(
-            (
-                teeth.polygons[0][: self.evaluations, :],
-                ([(0.5 * self.wgt.wg_width, 0), (-0.5 * self.wgt.wg_width, 0)]),
-            )
+        c3 = neff ** 2 - sin_theta ** 2
+        w = 0.5 * width
+
+        # All the tooth curves are evaluated at once, on the same t values (t from 0 to 1 spans the width)
+        q = np.arange(qmin, qmin + num_teeth)[:, np.newaxis]
+        c1, c2 = q * wavelength * sin_theta, (q * wavelength) ** 2
+
+        def tooth_curves(t):
+            x = width * t - w
+            root = np.sqrt(c2 - c3 * x ** 2)
+            return x, (c1 + neff * root) / c3, root
+
+        # The t grid is uniformly refined until every chord is within 0.01 of the curves (the tolerance that
+        # gdspy.Path.parametric uses), so a small number of evaluations still gives smooth teeth
+        t = np.linspace(0, 1, evaluations)
+        x, y, root = tooth_curves(t)
+        while True:
+            y_mid = tooth_curves(0.5 * (t[1:] + t[:-1]))[1]
+            error = 0.5 * (y[:, 1:] + y[:, :-1]) - y_mid
+            if not np.any(np.abs(error) > 0.01):
+                break
+            t = np.insert(t, np.arange(1, len(t)), 0.5 * (t[1:] + t[:-1]))
+            x, y, root = tooth_curves(t)
+        points = np.empty(y.shape + (2,))
+        points[..., 0] = x
+        points[..., 1] = y
+        # Analytic derivatives of the curves with respect to t, for the edges of the teeth
+        tangents = np.empty(points.shape)
+        tangents[..., 0] = width
+        tangents[..., 1] = -neff * width * x / root
+
+        teeth = gdspy.PolygonSet(
+            _get_curve_polygons(
+                points, tangents, self.period * self.dc, max_points=max_points
+            ),
+            **wg_spec
         )
+        first_edge = teeth.polygons[0][: min(len(t), max_points // 2)]
+        first_tooth = np.empty((len(first_edge) + 2, 2))
+        first_tooth[:-2] = first_edge
+        first_tooth[-2] = (0.5 * self.wgt.wg_width, 0)
+        first_tooth[-1] = (-0.5 * self.wgt.wg_width, 0)
+        teeth.polygons[0] = first_tooth
         teeth.fracture()
 
-        clad_path = gdspy.Path(self.wgt.wg_width + 2 * self.wgt.clad_width, (0, 0))
-        clad_path.segment(
+        # The teeth are built along +y and turned to +x, the cladding is built pointing in +x directly
+        teeth.polygons = _get_clockwise_quarter_turn(teeth.polygons)
+        clad_path = _get_clad_polygon(
+            self.wgt.wg_width + 2 * self.wgt.clad_width,
             self.focus_distance,
-            direction="+y",
-            final_width=self.width + 2 * self.wgt.clad_width,
+            self.width + 2 * self.wgt.clad_width,
+            self.length,
             **self.clad_spec
         )
-        clad_path.segment(self.length, direction="+y", **self.clad_spec)
-
-        teeth.rotate(-np.pi / 2.0, (0, 0))
-        path.rotate(-np.pi / 2.0, (0, 0))
-        clad_path.rotate(-np.pi / 2.0, (0, 0))
 
-        self.add(teeth)
-        self.add(path)
-        self.add(clad_path)
+        self.add([teeth, clad_path])
 
     def __build_ports(self):
         # Portlist format:
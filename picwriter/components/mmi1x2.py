@@ -38,6 +38,27 @@ class MMI1x2(tk.Component):
 
     """
 
+    __slots__ = (
+        "wgt",
+        "length",
+        "width",
+        "totlength",
+        "output_length",
+        "output_wg_sep",
+        "output_width",
+        "draw_outputs",
+        "taper_width",
+        "taper_length",
+        "draw_input",
+        "wg_sep",
+        "resist",
+        "wg_spec",
+        "clad_spec",
+        "input_port",
+        "output_port_top",
+        "output_port_bot",
+    )
+
     def __init__(
         self,
         wgt,
@@ -150,28 +171,32 @@ class MMI1x2(tk.Component):
         #        path1.segment(self.taper_length, direction='+x', final_width=self.taper_width, **self.wg_spec)
         #
         """ Add the MMI region """
-        mmi = gdspy.Path(self.width, (x, y))
-        mmi.segment(self.length, direction="+x", **self.wg_spec)
-        self.add(mmi)
-
-        clad_pts = [
-            (0.0, -self.wgt.wg_width / 2.0 - self.wgt.clad_width),
-            (self.taper_length, -self.width / 2.0 - self.wgt.clad_width),
-            (self.taper_length + self.length, -self.width / 2.0 - self.wgt.clad_width),
-            (
-                2 * self.taper_length + self.length,
-                -self.wg_sep / 2.0 - self.wgt.wg_width / 2.0 - self.wgt.clad_width,
-            ),
-            (
-                2 * self.taper_length + self.length,
-                self.wg_sep / 2.0 + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-            ),
-            (self.taper_length + self.length, self.width / 2.0 + self.wgt.clad_width),
-            (self.taper_length, self.width / 2.0 + self.wgt.clad_width),
-            (0.0, self.wgt.wg_width / 2.0 + self.wgt.clad_width),
-        ]
+        mmi = gdspy.Rectangle(
+            (x, y - 0.5 * self.width),
+            (x + self.length, y + 0.5 * self.width),
+            **self.wg_spec
+        )
+
+        # x positions of the cladding corners, and its half widths at the input, along the MMI region and at the outputs
+        tl, x1 = self.taper_length, self.taper_length + self.length
+        x2 = 2 * self.taper_length + self.length
+        a = self.wgt.wg_width / 2.0 + self.wgt.clad_width
+        b = self.width / 2.0 + self.wgt.clad_width
+        c = self.wg_sep / 2.0 + self.wgt.wg_width / 2.0 + self.wgt.clad_width
+        clad_pts = np.array(
+            [
+                (0.0, -a),
+                (tl, -b),
+                (x1, -b),
+                (x2, -c),
+                (x2, c),
+                (x1, b),
+                (tl, b),
+                (0.0, a),
+            ]
+        )
         clad = gdspy.Polygon(clad_pts, **self.clad_spec)
-        self.add(clad)
+        self.add([mmi, clad])
 
         (x, y) = (x + self.length, y)
 
@@ -188,15 +213,15 @@ class MMI1x2(tk.Component):
             )
             self.add(esb_top)
 
-            esb_bot = EulerSBend(
-                self.wgt,
-                self.output_length,
-                -dy,
-                self.output_width,
-                end_width=self.wgt.wg_width,
-                port=(x, y - self.wg_sep / 2.0),
+            # The bottom output bend is the mirror image of the top one, so the same cell is placed again (reflected
+            # about the x-axis) instead of building a second EulerSBend
+            self.add(
+                gdspy.CellReference(
+                    tk.CURRENT_CELLS[esb_top.cell_hash],
+                    origin=(x, y - self.wg_sep / 2.0),
+                    x_reflection=True,
+                )
             )
-            self.add(esb_bot)
 
     #        path3 = gdspy.Path(self.taper_width, (path2.x, path2.y+self.wg_sep/2.0))
     #        path3.turn(self.wgt.bend_radius, self.angle, number_of_points=self.wgt.get_num_points_wg(self.angle), final_width=self.wgt.wg_width, **self.wg_spec)
@@ -198,23 +198,28 @@ class MMI2x2(tk.Component):
             final_width=self.taper_width + 2 * self.wgt.clad_width,
             **self.clad_spec
         )
-        # MMI body
+        # MMI body (tapers out to the MMI width, runs along it, and tapers back in) as a single polygon
         c_start_width = 2 * self.wgt.clad_width + 2 * self.taper_width + self.wg_sep
-        clad_path3 = gdspy.Path(
-            c_start_width,
-            (angle_x_dist - self.wgt.clad_width, -self.wg_sep / 2.0 - angle_y_dist),
-        )
-        clad_path3.segment(
-            self.wgt.clad_width,
-            final_width=self.width + 2 * self.wgt.clad_width,
-            direction="+x",
-            **self.clad_spec
-        )
-        clad_path3.segment(self.length, direction="+x", **self.clad_spec)
-        clad_path3.segment(
-            self.wgt.clad_width,
-            final_width=c_start_width,
-            direction="+x",
+        x0 = angle_x_dist - self.wgt.clad_width
+        x1 = x0 + self.wgt.clad_width
+        x2 = x1 + self.length
+        x3 = x2 + self.wgt.clad_width
+        yc = -self.wg_sep / 2.0 - angle_y_dist
+        ws = 0.5 * c_start_width
+        wm = 0.5 * (self.width + 2 * self.wgt.clad_width)
+        clad_path3 = gdspy.Polygon(
+            np.array(
+                [
+                    (x0, yc - ws),
+                    (x1, yc - wm),
+                    (x2, yc - wm),
+                    (x3, yc - ws),
+                    (x3, yc + ws),
+                    (x2, yc + wm),
+                    (x1, yc + wm),
+                    (x0, yc + ws),
+                ]
+            ),
             **self.clad_spec
         )
         # Top output
@@ -58,6 +58,10 @@ class Ring(tk.Component):
             raise ValueError(
                 "Warning! Wrap_angle is nor a valid angle between 0 and pi."
             )
+        if parity not in (1, -1):
+            raise ValueError(
+                "Warning!  Parity value is not an acceptable value (must be +1 or -1)."
+            )
         self.parity = parity
         self.resist = wgt.resist
         self.wgt = wgt
@@ -76,75 +80,35 @@ class Ring(tk.Component):
     def __build_cell(self):
         # Sequentially build all the geometric shapes using gdspy path functions
         # for waveguide, then add it to the Cell
+        r, wg_w, cl_w = self.radius, self.wgt.wg_width, self.wgt.clad_width
+        rp = (
+            r + wg_w + self.coupling_gap
+        )  # distance from the bus waveguide to the ring center
+        # Number of points along each (inner and outer) edge of the ring and its cladding
+        n_ring = self.wgt.get_num_points_curve(2 * np.pi, r + wg_w / 2.0)
+        n_clad = self.wgt.get_num_points_curve(2 * np.pi, r + wg_w / 2.0 + cl_w)
+
         if self.draw_bus_wg:
             if self.wrap_angle == 0:
-                bus_length = 2 * self.radius
+                bus_length = 2 * r
                 # Add bus waveguide with cladding
-                path = gdspy.Path(self.wgt.wg_width, (0, 0))
-                path.segment(2 * self.radius, direction="+x", **self.wg_spec)
-                clad = gdspy.Path(2 * self.wgt.clad_width + self.wgt.wg_width, (0, 0))
-                clad.segment(2 * self.radius, direction="+x", **self.clad_spec)
+                path = gdspy.Path(wg_w, (0, 0))
+                path.segment(2 * r, direction="+x", **self.wg_spec)
+                clad = gdspy.Path(2 * cl_w + wg_w, (0, 0))
+                clad.segment(2 * r, direction="+x", **self.clad_spec)
 
                 # Ring resonator
-                if self.parity == 1:
-                    ring = gdspy.Round(
-                        (
-                            self.radius,
-                            self.radius + self.wgt.wg_width + self.coupling_gap,
-                        ),
-                        self.radius + self.wgt.wg_width / 2.0,
-                        self.radius - self.wgt.wg_width / 2.0,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(2 * np.pi, self.radius),
-                        **self.wg_spec
-                    )
-                    clad_ring = gdspy.Round(
-                        (
-                            self.radius,
-                            self.radius + self.wgt.wg_width + self.coupling_gap,
-                        ),
-                        self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                        self.radius - self.wgt.wg_width / 2.0 - self.wgt.clad_width,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(2 * np.pi, self.radius),
-                        **self.clad_spec
-                    )
-                elif self.parity == -1:
-                    ring = gdspy.Round(
-                        (
-                            self.radius,
-                            -self.radius - self.wgt.wg_width - self.coupling_gap,
-                        ),
-                        self.radius + self.wgt.wg_width / 2.0,
-                        self.radius - self.wgt.wg_width / 2.0,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(2 * np.pi, self.radius),
-                        **self.wg_spec
-                    )
-                    clad_ring = gdspy.Round(
-                        (
-                            self.radius,
-                            -self.radius - self.wgt.wg_width - self.coupling_gap,
-                        ),
-                        self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                        self.radius - self.wgt.wg_width / 2.0 - self.wgt.clad_width,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(2 * np.pi, self.radius),
-                        **self.clad_spec
-                    )
-                else:
-                    raise ValueError(
-                        "Warning!  Parity value is not an acceptable value (must be +1 or -1)."
-                    )
+                center = (r, self.parity * rp)
+                n_ring = n_clad = self.wgt.get_num_points_curve(2 * np.pi, r)
             elif self.wrap_angle > 0:
                 theta = self.wrap_angle / 2.0
-                rp = self.radius + self.wgt.wg_width + self.coupling_gap
                 dx, dy = rp * np.sin(theta), rp - rp * np.cos(theta)
-                bus_length = 2 * self.radius if (4 * dx < 2 * self.radius) else 4 * dx
+                bus_length = 2 * r if (4 * dx < 2 * r) else 4 * dx
+                n_arc = 2 * self.wgt.get_num_points_curve(self.wrap_angle, rp)
 
                 # Add bus waveguide with cladding that wraps
-                path = gdspy.Path(self.wgt.wg_width, (0, 0))
-                clad = gdspy.Path(2 * self.wgt.clad_width + self.wgt.wg_width, (0, 0))
+                path = gdspy.Path(wg_w, (0, 0))
+                clad = gdspy.Path(2 * cl_w + wg_w, (0, 0))
                 if 4 * dx < bus_length:
                     path.segment(
                         (bus_length - 4 * dx) / 2.0, direction="+x", **self.wg_spec
@@ -152,183 +116,37 @@ class Ring(tk.Component):
                     clad.segment(
                         (bus_length - 4 * dx) / 2.0, direction="+x", **self.clad_spec
                     )
-                    xcenter = self.radius
+                    xcenter = r
                 else:
                     xcenter = 2 * dx
 
-                if self.parity == 1:
-                    path.arc(
+                # The parity -1 bus is the mirror image (about the x-axis) of the parity 1 bus
+                sign = self.parity
+                for bus, spec in [(path, self.wg_spec), (clad, self.clad_spec)]:
+                    bus.arc(
                         rp,
-                        np.pi / 2.0,
-                        np.pi / 2.0 - theta,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.wg_spec
+                        sign * np.pi / 2.0,
+                        sign * (np.pi / 2.0 - theta),
+                        number_of_points=n_arc,
+                        **spec
                     )
-                    path.arc(
+                    bus.arc(
                         rp,
-                        -np.pi / 2.0 - theta,
-                        -np.pi / 2.0 + theta,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.wg_spec
+                        sign * (-np.pi / 2.0 - theta),
+                        sign * (-np.pi / 2.0 + theta),
+                        number_of_points=n_arc,
+                        **spec
                     )
-                    path.arc(
+                    bus.arc(
                         rp,
-                        np.pi / 2.0 + theta,
-                        np.pi / 2.0,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.wg_spec
-                    )
-                    clad.arc(
-                        rp,
-                        np.pi / 2.0,
-                        np.pi / 2.0 - theta,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.clad_spec
-                    )
-                    clad.arc(
-                        rp,
-                        -np.pi / 2.0 - theta,
-                        -np.pi / 2.0 + theta,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.clad_spec
-                    )
-                    clad.arc(
-                        rp,
-                        np.pi / 2.0 + theta,
-                        np.pi / 2.0,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.clad_spec
+                        sign * (np.pi / 2.0 + theta),
+                        sign * np.pi / 2.0,
+                        number_of_points=n_arc,
+                        **spec
                     )
 
-                    # Make the ring resonator
-                    ring = gdspy.Round(
-                        (
-                            xcenter,
-                            self.radius
-                            + self.wgt.wg_width
-                            + self.coupling_gap
-                            - 2 * dy,
-                        ),
-                        self.radius + self.wgt.wg_width / 2.0,
-                        self.radius - self.wgt.wg_width / 2.0,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(
-                            2 * np.pi, self.radius + self.wgt.wg_width / 2.0
-                        ),
-                        **self.wg_spec
-                    )
-                    clad_ring = gdspy.Round(
-                        (
-                            xcenter,
-                            self.radius
-                            + self.wgt.wg_width
-                            + self.coupling_gap
-                            - 2 * dy,
-                        ),
-                        self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                        self.radius - self.wgt.wg_width / 2.0 - self.wgt.clad_width,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(
-                            2 * np.pi,
-                            self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                        ),
-                        **self.clad_spec
-                    )
-
-                elif self.parity == -1:
-                    path.arc(
-                        rp,
-                        -np.pi / 2.0,
-                        -np.pi / 2.0 + theta,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.wg_spec
-                    )
-                    path.arc(
-                        rp,
-                        np.pi / 2.0 + theta,
-                        np.pi / 2.0 - theta,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.wg_spec
-                    )
-                    path.arc(
-                        rp,
-                        -np.pi / 2.0 - theta,
-                        -np.pi / 2.0,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.wg_spec
-                    )
-                    clad.arc(
-                        rp,
-                        -np.pi / 2.0,
-                        -np.pi / 2.0 + theta,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.clad_spec
-                    )
-                    clad.arc(
-                        rp,
-                        np.pi / 2.0 + theta,
-                        np.pi / 2.0 - theta,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.clad_spec
-                    )
-                    clad.arc(
-                        rp,
-                        -np.pi / 2.0 - theta,
-                        -np.pi / 2.0,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(self.wrap_angle, rp),
-                        **self.clad_spec
-                    )
-
-                    # Make the ring resonator
-                    ring = gdspy.Round(
-                        (
-                            xcenter,
-                            -self.radius
-                            - self.wgt.wg_width
-                            - self.coupling_gap
-                            + 2 * dy,
-                        ),
-                        self.radius + self.wgt.wg_width / 2.0,
-                        self.radius - self.wgt.wg_width / 2.0,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(
-                            2 * np.pi, self.radius + self.wgt.wg_width / 2.0
-                        ),
-                        **self.wg_spec
-                    )
-                    clad_ring = gdspy.Round(
-                        (
-                            xcenter,
-                            -self.radius
-                            - self.wgt.wg_width
-                            - self.coupling_gap
-                            + 2 * dy,
-                        ),
-                        self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                        self.radius - self.wgt.wg_width / 2.0 - self.wgt.clad_width,
-                        number_of_points=2
-                        * self.wgt.get_num_points_curve(
-                            2 * np.pi,
-                            self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                        ),
-                        **self.clad_spec
-                    )
-                else:
-                    raise ValueError(
-                        "Warning!  Parity value is not an acceptable value (must be +1 or -1)."
-                    )
+                # Ring resonator
+                center = (xcenter, sign * (rp - 2 * dy))
 
                 if 4 * dx < bus_length:
                     path.segment((bus_length - 4 * dx) / 2.0, **self.wg_spec)
@@ -336,54 +154,7 @@ class Ring(tk.Component):
         else:
             # Ring resonator
             bus_length = 0
-            if self.parity == 1:
-                ring = gdspy.Round(
-                    (0, self.radius + self.wgt.wg_width + self.coupling_gap),
-                    self.radius + self.wgt.wg_width / 2.0,
-                    self.radius - self.wgt.wg_width / 2.0,
-                    number_of_points=2
-                    * self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius + self.wgt.wg_width / 2.0
-                    ),
-                    **self.wg_spec
-                )
-                clad_ring = gdspy.Round(
-                    (0, self.radius + self.wgt.wg_width + self.coupling_gap),
-                    self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                    self.radius - self.wgt.wg_width / 2.0 - self.wgt.clad_width,
-                    number_of_points=2
-                    * self.wgt.get_num_points_curve(
-                        2 * np.pi,
-                        self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                    ),
-                    **self.clad_spec
-                )
-            elif self.parity == -1:
-                ring = gdspy.Round(
-                    (0, -self.radius - self.wgt.wg_width - self.coupling_gap),
-                    self.radius + self.wgt.wg_width / 2.0,
-                    self.radius - self.wgt.wg_width / 2.0,
-                    number_of_points=2
-                    * self.wgt.get_num_points_curve(
-                        2 * np.pi, self.radius + self.wgt.wg_width / 2.0
-                    ),
-                    **self.wg_spec
-                )
-                clad_ring = gdspy.Round(
-                    (0, -self.radius - self.wgt.wg_width - self.coupling_gap),
-                    self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                    self.radius - self.wgt.wg_width / 2.0 - self.wgt.clad_width,
-                    number_of_points=2
-                    * self.wgt.get_num_points_curve(
-                        2 * np.pi,
-                        self.radius + self.wgt.wg_width / 2.0 + self.wgt.clad_width,
-                    ),
-                    **self.clad_spec
-                )
-            else:
-                raise ValueError(
-                    "Warning!  Parity value is not an acceptable value (must be +1 or -1)."
-                )
+            center = (0, self.parity * rp)
 
         self.port_input = (0, 0)
         self.port_output = (bus_length, 0)
@@ -391,8 +162,23 @@ class Ring(tk.Component):
         if not self.draw_bus_wg:
             self.port_output = (0, 0)
 
-        self.add(ring)
-        self.add(clad_ring)
+        # The ring and its cladding are concentric annuli, traced from vectorized unit circles
+        # (shared by both layers when they have the same number of points).
+        unit_ring = tk.get_arc_points((0, 0), 1.0, 0.0, 2 * np.pi, n_ring + 1)
+        if n_clad != n_ring:
+            unit_clad = tk.get_arc_points((0, 0), 1.0, 0.0, 2 * np.pi, n_clad + 1)
+        else:
+            unit_clad = unit_ring
+        for unit_circle, half_width, spec in [
+            (unit_ring, wg_w / 2.0, self.wg_spec),
+            (unit_clad, wg_w / 2.0 + cl_w, self.clad_spec),
+        ]:
+            outer = center + (r + half_width) * unit_circle
+            if r - half_width > 0:
+                inner = center + (r - half_width) * unit_circle[::-1]
+                outer = np.vstack((outer, inner))
+            # else the layer is wider than the ring radius, so it is drawn as a filled disc
+            self.add(gdspy.Polygon(outer, **spec).fracture())
 
         if self.draw_bus_wg:
             self.add(path)
@@ -130,9 +130,7 @@ class StripSlotMMIConverter(tk.Component):
 
         if not self.input_strip:
             center_pt = (self.length / 2.0, 0)
-            path_mmi.rotate(np.pi, center_pt)
-            path_taper.rotate(np.pi, center_pt)
-            path_clad.rotate(np.pi, center_pt)
+            tk.half_turn([path_mmi, path_taper, path_clad], center_pt)
 
         self.add(path_mmi)
         self.add(path_taper)
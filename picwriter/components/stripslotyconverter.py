@@ -133,9 +133,7 @@ class StripSlotYConverter(tk.Component):
 
         if not self.input_strip:
             center_pt = (self.length / 2.0, 0)
-            path_strip.rotate(np.pi, center_pt)
-            path_slot.rotate(np.pi, center_pt)
-            path_clad.rotate(np.pi, center_pt)
+            tk.half_turn([path_strip, path_slot, path_clad], center_pt)
 
         self.add(path_strip)
         self.add(path_slot)
@@ -73,23 +73,21 @@ class Taper(tk.Component):
         # Sequentially build all the geometric shapes using gdspy path functions
         # for waveguide, then add it to the Cell
 
-        # Add waveguide taper
-        path = gdspy.Path(self.start_width, (0, 0))
-        path.segment(
-            self.length, direction=0.0, final_width=self.end_width, **self.wg_spec
+        # Add waveguide taper (a trapezoid, so its corners are written directly)
+        w0, w1 = 0.5 * self.start_width, 0.5 * self.end_width
+        path = gdspy.Polygon(
+            [(0, -w0), (self.length, -w1), (self.length, w1), (0, w0)], **self.wg_spec
         )
-        # Cladding for waveguide taper
-        path2 = gdspy.Path(2 * self.wgt.clad_width + self.wgt.wg_width, (0, 0))
-        path2.segment(
-            self.length,
-            direction=0.0,
-            final_width=2 * self.end_clad_width + self.end_width,
-            **self.clad_spec
-        )
-        path2.segment(self.extra_clad_length, **self.clad_spec)
-
-        self.add(path)
-        self.add(path2)
+        # Cladding for waveguide taper, followed by the extra straight cladding (if any) in the same polygon
+        c0 = 0.5 * (2 * self.wgt.clad_width + self.wgt.wg_width)
+        c1 = 0.5 * (2 * self.end_clad_width + self.end_width)
+        clad_pts = [(0, -c0), (self.length, -c1), (self.length, c1), (0, c0)]
+        if self.extra_clad_length > 0:
+            x = self.length + self.extra_clad_length
+            clad_pts[2:2] = [(x, -c1), (x, c1)]
+        path2 = gdspy.Polygon(clad_pts, **self.clad_spec)
+
+        self.add([path, path2])
 
     def __build_ports(self):
         # Portlist format:
@@ -7,6 +7,21 @@ import picwriter.toolkit as tk
 from picwriter.components.ebend import EBend
 
 
+_NUM_POINTS_WG = {}
+
+
+def _get_num_points_wg(angle, grid, bend_radius):
+    # See WaveguideTemplate.get_num_points_wg.  Keyed on the grid and bend radius too, so templates share the cache
+    # (and a template whose attributes change never gets a stale value).
+    key = (angle, grid, bend_radius)
+    if key not in _NUM_POINTS_WG:
+        if len(_NUM_POINTS_WG) >= 256:
+            _NUM_POINTS_WG.clear()
+        step = np.arccos(2 * (1 - (0.5 * grid / bend_radius)) ** 2 - 1)
+        _NUM_POINTS_WG[key] = 2 * int(np.ceil(abs(angle * 1.0 / step)))
+    return _NUM_POINTS_WG[key]
+
+
 class WaveguideTemplate:
     """Template for waveguides that contains standard information about the geometry and fabrication.  Supported waveguide types are **strip** (also known as 'channel' waveguides), **slot**, and **SWG** ('sub-wavelength grating', or 1D photonic crystal waveguides).
 
@@ -159,27 +174,18 @@ class WaveguideTemplate:
     def get_num_points_wg(self, angle):
         # This is determined from Eq 1 and 2 in "Design and simulation of silicon photonic schematics and layouts" by Chrostowski et al.
         # Factor of 2 because there are 2 sides of the path
-        return 2 * int(
-            np.ceil(
-                abs(
-                    angle
-                    * 1.0
-                    / np.arccos(2 * (1 - (0.5 * self.grid / self.bend_radius)) ** 2 - 1)
-                )
-            )
-        )
+        # Components ask for the same few bend angles over and over, so the result is memoized
+        return _get_num_points_wg(angle, self.grid, self.bend_radius)
 
-    def get_num_points_curve(self, angle, radius):
+    def get_num_points_curve(self, angle, radius, grid=None):
         # This is determined from Eq 1 and 2 in "Design and simulation of silicon photonic schematics and layouts" by Chrostowski et al.
-        return int(
-            np.ceil(
-                abs(
-                    angle
-                    * 1.0
-                    / np.arccos(2 * (1 - (0.5 * self.grid / radius)) ** 2 - 1)
-                )
-            )
+        # An optional 'grid' value overrides the template grid, allowing a coarser (or finer) discretization of the curve.
+        # `radius` may also be an array of radii, in which case an array of the number of points is returned.
+        grid = self.grid if grid == None else grid
+        num_points = np.ceil(
+            np.abs(angle * 1.0 / np.arccos(2 * (1 - (0.5 * grid / radius)) ** 2 - 1))
         )
+        return int(num_points) if np.ndim(num_points) == 0 else num_points.astype(int)
 
 
 class Waveguide(tk.Component):
@@ -332,7 +338,8 @@ class Waveguide(tk.Component):
                 # add straight segment
                 segment = segments[i]
                 direction = tk.get_exact_angle(segment[0], segment[1])
-                direction_deg = direction / np.pi * 180
+                # `None` for segments pointing EAST, so gdspy skips the identity rotation of every period
+                direction_deg = direction / np.pi * 180 or None
                 total_dist = tk.dist(segment[0], segment[1])
                 curr_point = segment[0]
                 if (
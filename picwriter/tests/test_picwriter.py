@@ -51,6 +51,17 @@ class TestPICwriter(TestCase):
         self.assertTrue(len(top.references) == 3)
         self.assertTrue(abs(top.area() - 26199.859978484103) <= AREA_TOL)
 
+    def test_numeric_direction(self):
+        # An integer direction (in radians) rotates the placed geometry along with the ports
+        top = gdspy.Cell("t2-numeric")
+        wgt = WaveguideTemplate(bend_radius=50, resist="+")
+        tp1 = Taper(wgt, 100.0, 0.0, port=(10, 20), direction=2)
+        tk.add(top, tp1)
+        points = np.concatenate(top.get_polygons(by_spec=True)[(1, 0)])
+        tip = points[np.argmax(np.hypot(points[:, 0] - 10, points[:, 1] - 20))]
+        self.assertTrue(np.allclose(tip, tp1.portlist["output"]["port"]))
+        self.assertTrue(np.allclose(points.min(axis=0), [-31.614684, 19.583853]))
+
     def test_grating_coupler_creation(self):
         top = gdspy.Cell("t3")
         wgt = WaveguideTemplate(bend_radius=50, resist="+", fab="ETCH")
@@ -168,6 +179,16 @@ class TestPICwriter(TestCase):
         self.assertTrue(len(top.references) == 2)
         self.assertTrue(abs(top.area() - 13133.710126840513) <= AREA_TOL)
 
+    def test_small_ring_creation(self):
+        # Cladding wider than the ring radius is a filled disc, not an annulus
+        top = gdspy.Cell("t7-small")
+        wgt = WaveguideTemplate(bend_radius=50, wg_width=1.0, resist="+")
+        r1 = Ring(wgt, 5.0, 1.0, parity=1)
+        tk.add(top, r1)
+        clad_area = top.area(by_spec=True)[(2, 0)]
+        print("Small ring cladding area = " + str(clad_area))
+        self.assertTrue(abs(clad_area - 964.7417487794366) <= AREA_TOL)
+
     def test_disk_creation(self):
         top = gdspy.Cell("t8")
         wgt = WaveguideTemplate(bend_radius=50, wg_width=1.0, resist="+")
@@ -181,6 +202,66 @@ class TestPICwriter(TestCase):
         self.assertTrue(len(top.references) == 2)
         self.assertTrue(abs(top.area() - 31543.258086158858) <= AREA_TOL)
 
+    def test_disk_wrap_creation(self):
+        top = gdspy.Cell("t8-wrap")
+        wgt = WaveguideTemplate(bend_radius=50, wg_width=1.0, resist="+")
+
+        wg1 = Waveguide([(0, 0), (100, 0)], wgt)
+        tk.add(top, wg1)
+        d1 = Disk(
+            wgt, 60.0, 1.0, wrap_angle=np.pi / 2.0, parity=1, **wg1.portlist["output"]
+        )
+        tk.add(top, d1)
+        d2 = Disk(wgt, 40.0, 0.6, wrap_angle=np.pi, parity=-1, **d1.portlist["output"])
+        tk.add(top, d2)
+        print("Disk (wrapped) area = " + str(top.area()))
+        print(len(top.references))
+        self.assertTrue(len(top.references) == 3)
+        self.assertTrue(abs(top.area() - 51715.28785747277) <= AREA_TOL)
+
+    def test_disk_cell_reuse(self):
+        top = gdspy.Cell("t8-reuse")
+        wgt = WaveguideTemplate(bend_radius=50, wg_width=1.0, resist="+")
+
+        d1 = Disk(wgt, 30.0, 0.5, wrap_angle=np.pi / 3.0, port=(0, 0))
+        num_polygons = len(tk.CURRENT_CELLS[d1.cell_hash].polygons)
+        d2 = Disk(wgt, 30.0, 0.5, wrap_angle=np.pi / 3.0, port=(200, 0))
+        tk.add(top, d1)
+        tk.add(top, d2)
+        self.assertTrue(d1.cell_hash == d2.cell_hash)
+        self.assertTrue(len(tk.CURRENT_CELLS[d2.cell_hash].polygons) == num_polygons)
+        self.assertTrue(top.references[0].ref_cell is top.references[1].ref_cell)
+
+    def test_disk_array(self):
+        top = gdspy.Cell("t8-array")
+        wgt = WaveguideTemplate(bend_radius=50, wg_width=1.0, resist="+")
+
+        ports = [(0, 0), (200, 0), (400, 0), (600, 0)]
+        disks = Disk.array(
+            wgt, [30.0, 30.0, 40.0, 30.0], 0.5, ports, parity=[1, 1, 1, -1]
+        )
+        for d in disks:
+            tk.add(top, d)
+        self.assertTrue(len(disks) == 4)
+        self.assertTrue(disks[0].cell_hash == disks[1].cell_hash)
+        self.assertTrue(len(set([d.cell_hash for d in disks])) == 3)
+        self.assertTrue(disks[2].portlist["input"]["port"] == (400, 0))
+        self.assertTrue(disks[2].portlist["output"]["port"] == (480.0, 0.0))
+        self.assertRaises(ValueError, Disk.array, wgt, [30.0, 40.0], 0.5, ports)
+
+    def test_arc_points(self):
+        angles = np.linspace(-0.3, 2.5, 500)
+        expected = np.column_stack((5 + 20 * np.cos(angles), -3 + 20 * np.sin(angles)))
+        pts = tk.get_arc_points((5, -3), 20.0, -0.3, 2.5, 500)
+        self.assertTrue(pts.shape == (500, 2))
+        self.assertTrue(np.abs(pts - expected).max() < 1e-9)
+
+        buf = np.zeros((502, 2))
+        out = tk.get_arc_points((5, -3), 20.0, -0.3, 2.5, 500, out=buf[1:501])
+        self.assertTrue(out.base is buf)
+        self.assertTrue(np.abs(buf[1:501] - expected).max() < 1e-9)
+        self.assertTrue(not buf[0].any() and not buf[501].any())
+
     # 	def test_mzi_creation(self):
     # 		top = gdspy.Cell("t-mzi")
     # 		wgt = WaveguideTemplate(bend_radius=50, wg_width=1.0, resist='+')
@@ -423,6 +504,25 @@ class TestPICwriter(TestCase):
         self.assertTrue(len(top.references) == 3)
         self.assertTrue(abs(top.area() - 6888.198875373508) <= AREA_TOL)
 
+    def test_eulersbend_zero_height(self):
+        wgt = WaveguideTemplate(bend_radius=25, resist="+")
+        for _ in range(2):
+            # A rejected S-bend must not register an empty cell for later instances to reuse
+            with self.assertRaises(ValueError):
+                EulerSBend(wgt, 200.0, 0.0)
+
+    def test_euler_radius_of_curvature(self):
+        wgt = WaveguideTemplate(bend_radius=25, resist="+")
+        for length, height in [(200.0, 100.0), (100.0, -30.0), (50.0, 50.0)]:
+            esb = EulerSBend(wgt, length, height)
+            t = esb.t
+            xp, yp = np.cos(np.pi * t ** 2 / 2.0), np.sin(np.pi * t ** 2 / 2.0)
+            xpp, ypp = -np.pi * t * yp, np.pi * t * xp
+            radius = esb.scale_factor * abs(
+                ((xp ** 2 + yp ** 2) ** 1.5) / (xp * ypp - yp * xpp)
+            )
+            self.assertTrue(abs(esb.get_radius_of_curvature() - radius) < 1e-9 * radius)
+
     def test_bbend_creation(self):
         top = gdspy.Cell("t-bbend")
         wgt = WaveguideTemplate(bend_radius=25, resist="+")
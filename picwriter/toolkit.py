@@ -8,12 +8,37 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import numpy as np
 import math
+import cmath
 import gdspy
 
+try:
+    _STRING_TYPES = (str, unicode)  # Python 2, where template names are unicode
+except NameError:
+    _STRING_TYPES = (str,)
+
 TOL = 1e-6
 CURRENT_CELLS = {}
 CURRENT_CELL_NAMES = {}
 
+""" Cardinal directions, in order of increasing angle (counter-clockwise quarter turns) """
+CARDINAL_DIRECTIONS = ("EAST", "NORTH", "WEST", "SOUTH")
+
+""" Maps each cardinal direction to its (angle, cos(angle), sin(angle)) """
+DIRECTION_TABLE = {
+    "EAST": (0.0, 1.0, 0.0),
+    "NORTH": (0.5 * np.pi, 0.0, 1.0),
+    "WEST": (np.pi, -1.0, 0.0),
+    "SOUTH": (1.5 * np.pi, 0.0, -1.0),
+}
+
+""" Maps each pair of cardinal directions that are a quarter turn apart to the angle of the turn between them
+(+pi/2 for counter-clockwise, -pi/2 for clockwise), see get_turn """
+TURN_TABLE = {
+    (direction, CARDINAL_DIRECTIONS[(i + turn) % 4]): turn * np.pi / 2.0
+    for i, direction in enumerate(CARDINAL_DIRECTIONS)
+    for turn in (1, -1)
+}
+
 
 def add(top_cell, component_cell, center=(0, 0), x_reflection=False):
     """First creates a CellReference to subcell, then adds this to topcell at location center.
@@ -57,11 +82,10 @@ def reset_database():
 
 
 def getCellName(name):
+    """Returns a unique cell name of the form `name_N`, where N is a per-prefix counter (reset by `reset_database()`).
+    Deterministic, so repeated runs produce identical GDS files."""
     global CURRENT_CELL_NAMES
-    if name not in CURRENT_CELL_NAMES.keys():
-        CURRENT_CELL_NAMES[name] = 1
-    else:
-        CURRENT_CELL_NAMES[name] += 1
+    CURRENT_CELL_NAMES[name] = CURRENT_CELL_NAMES.get(name, 0) + 1
     return str(name) + "_" + str(CURRENT_CELL_NAMES[name])
 
 
@@ -291,20 +315,7 @@ def get_turn(dir1, dir2):
        float  (+pi/2 or -pi/2)
 
     """
-    if (
-        (dir1 == "NORTH" and dir2 == "WEST")
-        or (dir1 == "WEST" and dir2 == "SOUTH")
-        or (dir1 == "SOUTH" and dir2 == "EAST")
-        or (dir1 == "EAST" and dir2 == "NORTH")
-    ):
-        return np.pi / 2.0
-    elif (
-        (dir1 == "NORTH" and dir2 == "EAST")
-        or (dir1 == "EAST" and dir2 == "SOUTH")
-        or (dir1 == "SOUTH" and dir2 == "WEST")
-        or (dir1 == "WEST" and dir2 == "NORTH")
-    ):
-        return -np.pi / 2.0
+    return TURN_TABLE.get((dir1, dir2))
 
 
 def flip_direction(direction):
@@ -318,14 +329,8 @@ def flip_direction(direction):
        direction (``'NORTH'``, ``'WEST'``, ``'SOUTH'``, or ``'EAST'``)
 
     """
-    if direction == "NORTH":
-        return "SOUTH"
-    if direction == "SOUTH":
-        return "NORTH"
-    if direction == "WEST":
-        return "EAST"
-    if direction == "EAST":
-        return "WEST"
+    if direction in DIRECTION_TABLE:
+        return CARDINAL_DIRECTIONS[(CARDINAL_DIRECTIONS.index(direction) + 2) % 4]
     elif isinstance(direction, float):
         return (direction + np.pi) % (2 * np.pi)
 
@@ -347,9 +352,10 @@ def translate_point(pt, length, direction, height=0.0):
     """
     if isinstance(direction, float):
         # direction is a float (in radians)
+        cos_d, sin_d = math.cos(direction), math.sin(direction)
         return (
-            pt[0] + length * np.cos(direction) - height * np.sin(direction),
-            pt[1] + length * np.sin(direction) + height * np.cos(direction),
+            pt[0] + length * cos_d - height * sin_d,
+            pt[1] + length * sin_d + height * cos_d,
         )
     elif str(direction) == "NORTH":
         return (pt[0] - height, pt[1] + length)
@@ -377,6 +383,66 @@ def normalize_angle(angle):
     return angle
 
 
+def half_turn(elements, center):
+    """Rotates the polygons of every gdspy element in `elements` by pi about `center`, in place.
+    All vertices are transformed together as (x,y) -> 2*center - (x,y), which is exact, instead of calling `rotate` on each element.
+    Unlike gdspy's `rotate`, the end point and direction of a gdspy.Path are not updated.
+
+    Args:
+       * **elements** (list):  List of gdspy polygon-like objects (Polygon, PolygonSet, Path, ...)
+       * **center** (tuple):  Point about which the elements are rotated
+
+    """
+    polygons = [p for e in elements for p in e.polygons]
+    if len(polygons) == 0:
+        return
+    turned = 2 * np.asarray(center, dtype=float) - np.concatenate(polygons)
+    split = np.split(turned, np.cumsum([len(p) for p in polygons[:-1]]))
+    i = 0
+    for e in elements:
+        n = len(e.polygons)
+        e.polygons = split[i : i + n]
+        i += n
+
+
+def get_arc_points(
+    center, radius, initial_angle, final_angle, number_of_points, out=None
+):
+    """Returns the points along a circular arc, computed in a single vectorized pass.
+
+    Rather than evaluating cos/sin at every point, the points are generated by repeatedly
+    rotating the first point by the (constant) angular step, i.e. a cumulative product of
+    unit complex numbers.  Only two transcendental evaluations are needed per arc, and the
+    accumulated error (~1e-15 per step) is far below any layout grid.
+
+    Args:
+       * **center** (tuple):  Center of the circle
+       * **radius** (float):  Radius of the arc
+       * **initial_angle** (float):  Starting angle of the arc, in *radians*
+       * **final_angle** (float):  Ending angle of the arc, in *radians*
+       * **number_of_points** (int):  Number of points along the arc (including both endpoints)
+
+    Keyword Args:
+       * **out** (numpy array):  Optional array of shape (number_of_points, 2) that the points are written into, e.g. a slice of a larger polygon.  Defaults to None (a new array is allocated).
+
+    Returns:
+       numpy array of shape (number_of_points, 2) with the (x,y) coordinates of the arc (`out`, if given)
+
+    """
+    rotations = np.empty(number_of_points, dtype=np.complex128)
+    rotations[0] = radius * cmath.exp(1j * initial_angle)
+    if number_of_points > 1:
+        rotations[1:] = cmath.exp(
+            1j * (final_angle - initial_angle) / (number_of_points - 1)
+        )
+    np.cumprod(rotations, out=rotations)
+
+    points = np.empty((number_of_points, 2)) if out is None else out
+    np.add(center[0], rotations.real, out=points[:, 0])
+    np.add(center[1], rotations.imag, out=points[:, 1])
+    return points
+
+
 def get_curve_length(func, start, end, grid=0.001):
     """Returns the length (in microns) of a curve defined by the function `func` on the interval [start, end]
 
@@ -580,6 +646,17 @@ class Component:
 
     """
 
+    # The attributes set here.  Subclasses that declare __slots__ for all of their own attributes are stored without an
+    # instance dict; subclasses without __slots__ still get one automatically.
+    __slots__ = (
+        "name_prefix",
+        "portlist",
+        "port",
+        "direction",
+        "cell_hash",
+        "first_cell",
+    )
+
     def __init__(self, name, *args):
         self.name_prefix = name
 
@@ -595,76 +672,41 @@ class Component:
         Go through all the ports and do the appropriate
         rotations and translations corresponding to the specified 'port' and 'direction'
         """
+        if self.direction in DIRECTION_TABLE:
+            # direction of the input port (which specifies whole component orientation)
+            angle, cos_a, sin_a = DIRECTION_TABLE[self.direction]
+            quarter_turns = CARDINAL_DIRECTIONS.index(self.direction)
+        elif isinstance(self.direction, float) or isinstance(self.direction, int):
+            angle = float(self.direction)
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            quarter_turns = None
+        else:
+            raise ValueError(
+                "The direction of the component has an invalid value: "
+                + str(self.direction)
+            )
+
         for key in self.portlist.keys():
             cur_port = self.portlist[key]["port"]
+            port_direction = self.portlist[key]["direction"]
+
+            if quarter_turns is not None:
+                # Rotate cardinal port directions by the same number of quarter turns
+                if port_direction in DIRECTION_TABLE:
+                    self.portlist[key]["direction"] = CARDINAL_DIRECTIONS[
+                        (CARDINAL_DIRECTIONS.index(port_direction) + quarter_turns) % 4
+                    ]
+            elif isinstance(port_direction, float) or isinstance(port_direction, int):
+                self.portlist[key]["direction"] = (port_direction + angle) % (2 * np.pi)
+            elif port_direction in DIRECTION_TABLE:
+                self.portlist[key]["direction"] = (
+                    DIRECTION_TABLE[port_direction][0] + angle
+                ) % (2 * np.pi)
+            else:
+                raise ValueError("One of the portlist directions has an invalid value.")
 
-            if (
-                self.direction == "EAST"
-            ):  # direction of the input port (which specifies whole component orientation)
-                angle = 0.0
-                # No angle change, don't rotate port directions
-            elif self.direction == "NORTH":
-                angle = np.pi / 2.0
-                # Rotate by
-                if self.portlist[key]["direction"] == "NORTH":
-                    self.portlist[key]["direction"] = "WEST"
-                elif self.portlist[key]["direction"] == "WEST":
-                    self.portlist[key]["direction"] = "SOUTH"
-                elif self.portlist[key]["direction"] == "SOUTH":
-                    self.portlist[key]["direction"] = "EAST"
-                elif self.portlist[key]["direction"] == "EAST":
-                    self.portlist[key]["direction"] = "NORTH"
-            elif self.direction == "WEST":
-                angle = np.pi
-                # Rotate by 180 degrees
-                if self.portlist[key]["direction"] == "NORTH":
-                    self.portlist[key]["direction"] = "SOUTH"
-                elif self.portlist[key]["direction"] == "WEST":
-                    self.portlist[key]["direction"] = "EAST"
-                elif self.portlist[key]["direction"] == "SOUTH":
-                    self.portlist[key]["direction"] = "NORTH"
-                elif self.portlist[key]["direction"] == "EAST":
-                    self.portlist[key]["direction"] = "WEST"
-            elif self.direction == "SOUTH":
-                angle = 3 * np.pi / 2.0
-                # Rotate by 270 degrees
-                if self.portlist[key]["direction"] == "NORTH":
-                    self.portlist[key]["direction"] = "EAST"
-                elif self.portlist[key]["direction"] == "EAST":
-                    self.portlist[key]["direction"] = "SOUTH"
-                elif self.portlist[key]["direction"] == "SOUTH":
-                    self.portlist[key]["direction"] = "WEST"
-                elif self.portlist[key]["direction"] == "WEST":
-                    self.portlist[key]["direction"] = "NORTH"
-            elif isinstance(self.direction, float) or isinstance(self.direction, int):
-                angle = float(self.direction)
-
-                if isinstance(self.portlist[key]["direction"], float) or isinstance(
-                    self.portlist[key]["direction"], int
-                ):
-                    self.portlist[key]["direction"] = (
-                        self.portlist[key]["direction"] + angle
-                    ) % (2 * np.pi)
-                else:
-                    if self.portlist[key]["direction"] == "EAST":
-                        self.portlist[key]["direction"] = (0.0 + angle) % (2 * np.pi)
-                    elif self.portlist[key]["direction"] == "NORTH":
-                        self.portlist[key]["direction"] = (np.pi / 2 + angle) % (
-                            2 * np.pi
-                        )
-                    elif self.portlist[key]["direction"] == "WEST":
-                        self.portlist[key]["direction"] = (np.pi + angle) % (2 * np.pi)
-                    elif self.portlist[key]["direction"] == "SOUTH":
-                        self.portlist[key]["direction"] = (3 * np.pi / 2 + angle) % (
-                            2 * np.pi
-                        )
-                    else:
-                        raise ValueError(
-                            "One of the portlist directions has an invalid value."
-                        )
-
-            dx = cur_port[0] * np.cos(angle) - cur_port[1] * np.sin(angle)
-            dy = cur_port[0] * np.sin(angle) + cur_port[1] * np.cos(angle)
+            dx = cur_port[0] * cos_a - cur_port[1] * sin_a
+            dy = cur_port[0] * sin_a + cur_port[1] * cos_a
 
             self.portlist[key]["port"] = (self.port[0] + dx, self.port[1] + dy)
 
@@ -673,20 +715,21 @@ class Component:
         If not, add the cell to the global CURRENT_CELLS dictionary.
         If so, point to the identical cell in the CURRENT_CELLS dictionary.
         """
-        dont_hash = ["port", "direction", "self"]  # list of keys not to be hashed
+        # list of keys not to be hashed ('vertex' only sets the placement of an EBend, like 'port')
+        dont_hash = ["port", "direction", "vertex", "self"]
         args = args[0]
         new_args = []
-        for k in args.keys():
+        for k, value in args.items():
             if k not in dont_hash:
-                try:
-                    if ("WaveguideTemplate" in args[k].name) or (
-                        "MetalTemplate" in args[k].name
-                    ):
+                # Look the name up without raising, since most arguments (floats, tuples, ...) have none
+                name = getattr(value, "name", None)
+                if isinstance(name, _STRING_TYPES):
+                    if ("WaveguideTemplate" in name) or ("MetalTemplate" in name):
                         new_args.append(
-                            args[k].name
+                            name
                         )  # WaveguideTemplates each have a unique name
-                except:
-                    new_args.append(args[k])
+                else:
+                    new_args.append(value)
 
         global CURRENT_CELLS
         properties = self.name_prefix + "".join([str(p) for p in new_args])
@@ -706,18 +749,18 @@ class Component:
         return CURRENT_CELLS[self.cell_hash]
 
     def __direction_to_rotation(self, direction):
-        # Returns a rotation (in degrees) given a 'direction' which can be a cardinal direction or an angle in radians
-        if isinstance(direction, float):
+        # Returns a rotation (in degrees) given a 'direction' which can be a cardinal direction or an angle in radians.
+        # All the component geometry is built at the origin pointing 'EAST', so this single rotation (applied by the
+        # CellReference) is the only transformation that the polygons ever go through.
+        # Unrotated references get `None`, so gdspy skips the rotation entirely (and writes no angle record).
+        if direction in DIRECTION_TABLE:
+            rotation = math.degrees(DIRECTION_TABLE[direction][0])
+        elif isinstance(direction, float) or isinstance(direction, int):
             # direction is a float in radians, but rotation should be a float in degrees
-            return direction * 180.0 / np.pi
-        elif str(direction) == "EAST":
-            return 0.0
-        elif str(direction) == "NORTH":
-            return 90.0
-        elif str(direction) == "WEST":
-            return 180.0
-        elif str(direction) == "SOUTH":
-            return 270.0
+            rotation = math.degrees(direction)
+        else:
+            return None
+        return rotation if rotation != 0 else None
 
     def add(self, element, origin=(0, 0), rotation=0.0, x_reflection=False):
         """ Add a reference to an element or list of elements to the cell associated with this component """